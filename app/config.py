@@ -3,7 +3,8 @@ Application configuration using pydantic-settings.
 Loads settings from environment variables and .env file.
 """
 
-from functools import lru_cache
+import json
+from functools import cache, cached_property
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -30,13 +31,13 @@ class Settings(BaseSettings):
     port: int = Field(default=8000, description="Server port")
 
     # CORS Settings
-    cors_origins: list[str] = Field(
-        default=["http://localhost:3000"],
+    cors_origins: tuple[str, ...] = Field(
+        default=("http://localhost:3000",),
         description="Allowed CORS origins",
     )
     cors_allow_credentials: bool = Field(default=True)
-    cors_allow_methods: list[str] = Field(default=["*"])
-    cors_allow_headers: list[str] = Field(default=["*"])
+    cors_allow_methods: tuple[str, ...] = Field(default=("*",))
+    cors_allow_headers: tuple[str, ...] = Field(default=("*",))
 
     # Redis Settings
     redis_host: str = Field(default="localhost", description="Redis host")
@@ -45,6 +46,13 @@ class Settings(BaseSettings):
     redis_db: int = Field(default=0, description="Redis database number")
     redis_ssl: bool = Field(default=False, description="Use SSL for Redis")
     redis_cache_ttl: int = Field(default=3600, description="Default cache TTL in seconds")
+    redis_max_connections: int = Field(default=50, ge=1, description="Redis pool size")
+    redis_pool_min_connections: int = Field(
+        default=4, ge=0, description="Redis connections opened at startup"
+    )
+    redis_pool_timeout_seconds: float = Field(
+        default=2.0, description="Max wait for a free Redis connection before failing"
+    )
 
     # Authentication Settings
     auth_service_url: str = Field(
@@ -64,18 +72,18 @@ class Settings(BaseSettings):
 
     # File Upload Settings
     max_file_size_mb: int = Field(default=10, description="Maximum file size in MB")
-    allowed_image_extensions: list[str] = Field(
-        default=["jpg", "jpeg", "png", "gif", "webp", "svg"],
+    allowed_image_extensions: tuple[str, ...] = Field(
+        default=("jpg", "jpeg", "png", "gif", "webp", "svg"),
         description="Allowed image file extensions",
     )
-    allowed_mime_types: list[str] = Field(
-        default=[
+    allowed_mime_types: tuple[str, ...] = Field(
+        default=(
             "image/jpeg",
             "image/png",
             "image/gif",
             "image/webp",
             "image/svg+xml",
-        ],
+        ),
         description="Allowed MIME types",
     )
 
@@ -91,29 +99,64 @@ class Settings(BaseSettings):
     rate_limit_requests: int = Field(default=100, description="Rate limit requests")
     rate_limit_window_seconds: int = Field(default=60, description="Rate limit window")
 
+    # Health Checks
+    health_cache_ttl_seconds: float = Field(
+        default=2.0, description="How long dependency health results are reused"
+    )
+    health_probe_timeout_seconds: float = Field(
+        default=0.5, description="Max time a single dependency probe may take"
+    )
+
+    # Image Processing
+    cpu_worker_threads: int = Field(
+        default=4, ge=1, description="Maximum image analysis jobs run in parallel"
+    )
+
+    # Compression
+    gzip_minimum_size: int = Field(
+        default=1024, description="Minimum response size in bytes before gzip is applied"
+    )
+
     @field_validator(
         "cors_origins", "allowed_image_extensions", "allowed_mime_types", mode="before"
     )
     @classmethod
-    def parse_list(cls, v: str | list[str]) -> list[str]:
+    def parse_list(cls, v: str | list[str] | tuple[str, ...]) -> tuple[str, ...]:
         """Parse string list from environment variable."""
+        if isinstance(v, tuple):
+            return v
+        if isinstance(v, list):
+            return tuple(v)
         if isinstance(v, str):
-            import json
-
             try:
                 parsed_result = json.loads(v)
                 if isinstance(parsed_result, list):
-                    return [str(item) for item in parsed_result]
-                return [str(v)]
+                    return tuple(str(item) for item in parsed_result)
+                return (str(v),)
             except json.JSONDecodeError:
-                return [item.strip() for item in v.split(",")]
-        return v
+                return tuple(item.strip() for item in v.split(","))
+        return tuple(v)
 
     @property
     def max_file_size_bytes(self) -> int:
         """Get maximum file size in bytes."""
         return self.max_file_size_mb * 1024 * 1024
 
+    @property
+    def max_request_body_bytes(self) -> int:
+        """Get the largest request body accepted (two images plus multipart framing)."""
+        return 2 * self.max_file_size_bytes + 1024 * 1024
+
+    @cached_property
+    def allowed_extensions_set(self) -> frozenset[str]:
+        """Get lowercased allowed image extensions for membership checks."""
+        return frozenset(ext.lower() for ext in self.allowed_image_extensions)
+
+    @cached_property
+    def allowed_mime_types_set(self) -> frozenset[str]:
+        """Get lowercased allowed MIME types for membership checks."""
+        return frozenset(t.lower() for t in self.allowed_mime_types)
+
     @property
     def redis_url(self) -> str:
         """Construct Redis URL from components."""
@@ -122,7 +165,7 @@ class Settings(BaseSettings):
         return f"{protocol}://{auth}{self.redis_host}:{self.redis_port}/{self.redis_db}"
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
@@ -4,19 +4,20 @@ FastAPI dependency injection providers.
 
 import logging
 from collections.abc import Awaitable, Callable
+from functools import cache
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.config import Settings, get_settings
 from app.models.common import User
-from app.services.auth_service import AuthenticationError, AuthService, get_auth_service
-from app.services.brand_service import BrandService, get_brand_service
-from app.services.color_service import ColorService, get_color_service
-from app.services.redis_service import RedisService, get_redis_service
-from app.services.storage_service import StorageService, get_storage_service
-from app.services.validation_service import ValidationService, get_validation_service
-from app.services.wcag_service import WCAGService, get_wcag_service
+from app.services.auth_service import AuthenticationError, AuthService
+from app.services.brand_service import BrandService
+from app.services.color_service import ColorService
+from app.services.redis_service import RedisService
+from app.services.storage_service import StorageService
+from app.services.validation_service import ValidationService
+from app.services.wcag_service import WCAGService
 
 logger = logging.getLogger(__name__)
 
@@ -24,45 +25,43 @@ logger = logging.getLogger(__name__)
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
-async def get_settings_dep() -> Settings:
-    """Dependency to get application settings."""
-    return get_settings()
-
-
-async def get_redis(settings: Settings = Depends(get_settings_dep)) -> RedisService:
+async def get_redis(request: Request) -> RedisService:
     """
     Dependency to get Redis service.
 
+    The service is created once in the application lifespan and stored on
+    ``app.state``, so no settings lookup or connection check happens per request.
+
     Args:
-        settings: Application settings.
+        request: The incoming request.
 
     Returns:
         RedisService instance.
     """
-    return await get_redis_service()
+    redis: RedisService = request.app.state.redis
+    return redis
 
 
-async def get_auth(settings: Settings = Depends(get_settings_dep)) -> AuthService:
+async def get_auth(request: Request) -> AuthService:
     """
     Dependency to get auth service.
 
     Args:
-        settings: Application settings.
+        request: The incoming request.
 
     Returns:
-        AuthService instance.
+        AuthService instance created at startup.
     """
-    return get_auth_service()
+    auth_service: AuthService = request.app.state.auth_service
+    return auth_service
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
-    auth_service: AuthService = Depends(get_auth),
+async def _authenticate(
+    credentials: HTTPAuthorizationCredentials | None,
+    auth_service: AuthService,
 ) -> User:
     """
-    Dependency to get the current authenticated user.
-
-    Extracts and verifies JWT token from Authorization header.
+    Verify bearer credentials and return the user.
 
     Args:
         credentials: Bearer token credentials.
@@ -98,6 +97,28 @@ async def get_current_user(
         ) from e
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    auth_service: AuthService = Depends(get_auth),
+) -> User:
+    """
+    Dependency to get the current authenticated user.
+
+    Extracts and verifies JWT token from Authorization header.
+
+    Args:
+        credentials: Bearer token credentials.
+        auth_service: Auth service for verification.
+
+    Returns:
+        Authenticated User object.
+
+    Raises:
+        HTTPException: If authentication fails.
+    """
+    return await _authenticate(credentials, auth_service)
+
+
 async def get_optional_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     auth_service: AuthService = Depends(get_auth),
@@ -123,10 +144,14 @@ async def get_optional_user(
         return None
 
 
+@cache
 def require_permission(permission: str) -> Callable[..., Awaitable[User]]:
     """
     Dependency factory to require a specific permission.
 
+    Memoized so every use of the same permission shares one checker, which
+    FastAPI then resolves once per request via its dependency cache.
+
     Args:
         permission: The required permission.
 
@@ -142,9 +167,12 @@ def require_permission(permission: str) -> Callable[..., Awaitable[User]]:
     """
 
     async def permission_checker(
-        current_user: User = Depends(get_current_user),
-        auth_service: AuthService = Depends(get_auth),
+        request: Request,
+        credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     ) -> User:
+        # Authenticate inline so the solver resolves one dependency, not three
+        auth_service: AuthService = request.app.state.auth_service
+        current_user = await _authenticate(credentials, auth_service)
         if not auth_service.has_permission(current_user, permission):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -158,10 +186,13 @@ def require_permission(permission: str) -> Callable[..., Awaitable[User]]:
     return permission_checker
 
 
+@cache
 def require_role(role: str) -> Callable[..., Awaitable[User]]:
     """
     Dependency factory to require a specific role.
 
+    Memoized so every use of the same role shares one checker.
+
     Args:
         role: The required role.
 
@@ -177,9 +208,11 @@ def require_role(role: str) -> Callable[..., Awaitable[User]]:
     """
 
     async def role_checker(
-        current_user: User = Depends(get_current_user),
-        auth_service: AuthService = Depends(get_auth),
+        request: Request,
+        credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     ) -> User:
+        auth_service: AuthService = request.app.state.auth_service
+        current_user = await _authenticate(credentials, auth_service)
         if not auth_service.has_role(current_user, role):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -193,76 +226,71 @@ def require_role(role: str) -> Callable[..., Awaitable[User]]:
     return role_checker
 
 
-async def get_color_service_dep() -> ColorService:
+async def get_color_service_dep(request: Request) -> ColorService:
     """Dependency to get color service."""
-    return get_color_service()
+    color_service: ColorService = request.app.state.color_service
+    return color_service
 
 
-async def get_brand_service_dep(
-    redis: RedisService = Depends(get_redis),
-) -> BrandService:
+async def get_brand_service_dep(request: Request) -> BrandService:
     """
     Dependency to get brand service.
 
     Args:
-        redis: Redis service for caching.
+        request: The incoming request.
 
     Returns:
-        BrandService instance.
+        BrandService instance created at startup.
     """
-    return get_brand_service(redis)
+    brand_service: BrandService = request.app.state.brand_service
+    return brand_service
 
 
-async def get_wcag_service_dep(
-    color_service: ColorService = Depends(get_color_service_dep),
-    redis: RedisService = Depends(get_redis),
-) -> WCAGService:
+async def get_wcag_service_dep(request: Request) -> WCAGService:
     """
     Dependency to get WCAG service.
 
     Args:
-        color_service: Color service for contrast calculations.
-        redis: Redis service for caching.
+        request: The incoming request.
 
     Returns:
-        WCAGService instance.
+        WCAGService instance created at startup.
     """
-    return get_wcag_service(color_service, redis)
+    wcag_service: WCAGService = request.app.state.wcag_service
+    return wcag_service
 
 
-async def get_validation_service_dep(
-    redis: RedisService = Depends(get_redis),
-) -> ValidationService:
+async def get_validation_service_dep(request: Request) -> ValidationService:
     """
     Dependency to get validation service.
 
     Args:
-        redis: Redis service for storage.
+        request: The incoming request.
 
     Returns:
-        ValidationService instance.
+        ValidationService instance created at startup.
     """
-    return get_validation_service(redis)
+    validation_service: ValidationService = request.app.state.validation_service
+    return validation_service
 
 
-async def get_storage_service_dep(
-    redis: RedisService = Depends(get_redis),
-) -> StorageService:
+async def get_storage_service_dep(request: Request) -> StorageService:
     """
     Dependency to get storage service.
 
     Args:
-        redis: Redis service for metadata storage.
+        request: The incoming request.
 
     Returns:
-        StorageService instance.
+        StorageService instance created at startup.
     """
-    return get_storage_service(redis)
+    storage_service: StorageService = request.app.state.storage_service
+    return storage_service
 
 
 async def verify_api_key(
     x_api_key: str | None = Header(None, alias="X-API-Key"),
-    settings: Settings = Depends(get_settings_dep),
+    settings: Settings = Depends(get_settings),
 ) -> bool:
     """
     Dependency to verify API key for service-to-service auth.
@@ -12,9 +12,11 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config import get_settings
 from app.middleware.error_handler import ErrorHandlerMiddleware, setup_exception_handlers
+from app.middleware.request_size import RequestSizeLimitMiddleware
 from app.routers import (
     brand_router,
     colors_router,
@@ -22,7 +24,13 @@ from app.routers import (
     validate_router,
     wcag_router,
 )
-from app.services.redis_service import close_redis_service, get_redis_service
+from app.services.auth_service import get_auth_service
+from app.services.brand_service import get_brand_service
+from app.services.color_service import get_color_service
+from app.services.redis_service import RedisService, close_redis_service, get_redis_service
+from app.services.storage_service import get_storage_service
+from app.services.validation_service import get_validation_service
+from app.services.wcag_service import get_wcag_service
 
 # Configure logging
 logging.basicConfig(
@@ -45,11 +53,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Initialize Redis connection
     try:
-        await get_redis_service()
+        app.state.redis = await get_redis_service()
         logger.info("Redis connection established")
     except Exception as e:
         logger.warning(f"Failed to connect to Redis: {e}")
         # Continue without Redis - some features may be degraded
+        app.state.redis = RedisService(settings)
+
+    # Build service singletons up front so the first request does not pay for them
+    redis = app.state.redis
+    app.state.auth_service = get_auth_service()
+    app.state.color_service = get_color_service()
+    app.state.brand_service = get_brand_service(redis)
+    app.state.wcag_service = get_wcag_service(app.state.color_service, redis)
+    app.state.validation_service = get_validation_service(redis)
+    app.state.storage_service = get_storage_service(redis)
+
+    # Generate the OpenAPI schema now; FastAPI caches it on app.openapi_schema
+    app.openapi()
 
     logger.info(f"StayOnBoard API v{settings.app_version} started in {settings.environment} mode")
 
@@ -106,6 +127,12 @@ in response headers.
         lifespan=lifespan,
     )
 
+    # Reject oversize uploads from their Content-Length before the body is read
+    app.add_middleware(RequestSizeLimitMiddleware, max_body_bytes=settings.max_request_body_bytes)
+
+    # Compress large JSON bodies (already-compressed images are skipped by the middleware)
+    app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size, compresslevel=6)
+
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -137,26 +164,40 @@ in response headers.
 app = create_application()
 
 
+_SETTINGS = get_settings()
+
+# Static root payload, built once instead of on every request
+_ROOT_INFO: dict[str, str | None] = {
+    "name": _SETTINGS.app_name,
+    "version": _SETTINGS.app_version,
+    "docs": "/docs" if _SETTINGS.debug else None,
+    "health": "/api/v1/health",
+}
+
+
 @app.get("/", include_in_schema=False)
 async def root() -> dict[str, str | None]:
     """Root endpoint redirect to docs."""
-    settings = get_settings()
-    return {
-        "name": settings.app_name,
-        "version": settings.app_version,
-        "docs": "/docs" if settings.debug else None,
-        "health": "/api/v1/health",
-    }
+    return _ROOT_INFO
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
     settings = get_settings()
+    # uvloop and httptools ship with the uvicorn[standard] extra
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        workers=None if settings.debug else os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
         log_level=settings.log_level.lower(),
+        access_log=settings.debug,
+        server_header=False,
+        date_header=False,
     )
@@ -8,9 +8,11 @@ from app.middleware.error_handler import (
     http_exception_handler,
     validation_exception_handler,
 )
+from app.middleware.request_size import RequestSizeLimitMiddleware
 
 __all__ = [
     "ErrorHandlerMiddleware",
+    "RequestSizeLimitMiddleware",
     "global_exception_handler",
     "http_exception_handler",
     "validation_exception_handler",
@@ -2,88 +2,207 @@
 Error handling middleware and exception handlers.
 """
 
+import binascii
 import logging
-import traceback
-import uuid
-from collections.abc import Callable
+import os
+from datetime import UTC, datetime
+from typing import Any
 
+import orjson
 from fastapi import FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import get_settings
-from app.models.common import ErrorDetail, ErrorResponse
 
 logger = logging.getLogger(__name__)
 
+# Settings are immutable for the process lifetime, so bind the debug flag once
+_DEBUG = get_settings().debug
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
+
+# Raw ASGI header name; ASGI requires lowercase header names
+_HDR_REQUEST_ID = b"x-request-id"
+
+
+def new_request_id() -> str:
+    """
+    Generate a random request ID.
+
+    Returns:
+        A 32-character hex string with 128 bits of randomness.
+    """
+    return os.urandom(16).hex()
+
+
+def _new_request_id_bytes() -> bytes:
+    """
+    Generate a random request ID as ASCII bytes, ready for a raw ASGI header.
+
+    Returns:
+        32 hex characters as bytes with 128 bits of randomness.
+    """
+    return binascii.hexlify(os.urandom(16))
+
+
+def _get_request_id(request: Request) -> str:
+    """
+    Get the request ID assigned by ErrorHandlerMiddleware.
+
+    Reads the scope state dict directly instead of going through
+    ``request.state``; falls back to a fresh ID if the middleware did not run.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        The request ID.
+    """
+    request_id: str | None = request.scope.get("state", {}).get("request_id")
+    return request_id or new_request_id()
+
+
+def error_detail(
+    code: str,
+    message: str,
+    field: str | None = None,
+    details: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Build a plain dict matching the ErrorDetail schema.
+
+    Args:
+        code: Error code.
+        message: Error message.
+        field: Field that caused the error.
+        details: Additional details.
+
+    Returns:
+        Dict with the ErrorDetail fields.
+    """
+    return {"code": code, "message": message, "field": field, "details": details}
+
+
+def error_response(
+    status_code: int,
+    message: str,
+    request_id: str,
+    errors: list[dict[str, Any]],
+) -> Response:
+    """
+    Serialize an error body matching the ErrorResponse schema.
+
+    The body is written straight to JSON bytes with orjson, skipping
+    pydantic model construction on every error path.
+
+    Args:
+        status_code: HTTP status code.
+        message: Human-readable message.
+        request_id: Request ID for tracking.
+        errors: List of ErrorDetail-shaped dicts.
+
+    Returns:
+        JSON response with the X-Request-ID header set.
+    """
+    body = {
+        "success": False,
+        "message": message,
+        "timestamp": datetime.now(UTC),
+        "errors": errors,
+        "request_id": request_id,
+    }
+    return Response(
+        content=orjson.dumps(body, option=orjson.OPT_UTC_Z),
+        status_code=status_code,
+        media_type="application/json",
+        headers={"X-Request-ID": request_id},
+    )
+
+
+class ErrorHandlerMiddleware:
     """
     Middleware for centralized error handling and request tracking.
 
     Adds request IDs, logs errors, and ensures consistent error responses.
+    Implemented as a pure ASGI middleware so requests are not bridged through
+    the extra task and memory stream that ``BaseHTTPMiddleware`` adds.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
         """
-        Process the request and handle any errors.
+        Initialize the middleware.
 
         Args:
-            request: The incoming request.
-            call_next: The next middleware/handler in the chain.
+            app: The next ASGI application in the chain.
+        """
+        self.app = app
 
-        Returns:
-            The response from the handler or an error response.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process the request and handle any errors.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate request ID
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        request_id_bytes = _new_request_id_bytes()
+        request_id = request_id_bytes.decode("ascii")
+        scope.setdefault("state", {})["request_id"] = request_id
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                # Add request ID to response headers unless a handler already did
+                headers = message.get("headers")
+                if headers is None:
+                    headers = message["headers"] = []
+                elif not isinstance(headers, list):
+                    headers = message["headers"] = list(headers)
+                if all(name != _HDR_REQUEST_ID for name, _ in headers):
+                    headers.append((_HDR_REQUEST_ID, request_id_bytes))
+            await send(message)
 
-        # Add request ID to response headers
         try:
-            response: Response = await call_next(request)
-            response.headers["X-Request-ID"] = request_id
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             # Log the error with request context
             logger.error(
-                f"Unhandled error in request {request_id}: {str(e)}",
+                f"Unhandled error in request {request_id}: {e.__class__.__name__}: {str(e)}",
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": scope["method"],
+                    "path": scope["path"],
                     "error": str(e),
                 },
                 exc_info=True,
             )
 
+            if response_started:
+                # Too late to send an error response; let the server close the connection
+                raise
+
             # Return error response
-            settings = get_settings()
-            error_response = ErrorResponse(
-                success=False,
-                message="An unexpected error occurred",
-                request_id=request_id,
-                errors=[
-                    ErrorDetail(
-                        code="INTERNAL_ERROR",
-                        message=str(e) if settings.debug else "Internal server error",
-                        field=None,
-                        details=None,
+            response = error_response(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "An unexpected error occurred",
+                request_id,
+                [
+                    error_detail(
+                        "INTERNAL_ERROR",
+                        str(e) if _DEBUG else "Internal server error",
                     )
                 ],
             )
-
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content=error_response.model_dump(mode="json"),
-                headers={"X-Request-ID": request_id},
-            )
+            await response(scope, receive, send)
 
 
 async def http_exception_handler(
@@ -100,26 +219,14 @@ async def http_exception_handler(
     Returns:
         JSON response with error details.
     """
-    request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
-
-    error_response = ErrorResponse(
-        success=False,
-        message=str(exc.detail),
-        request_id=request_id,
-        errors=[
-            ErrorDetail(
-                code=f"HTTP_{exc.status_code}",
-                message=str(exc.detail),
-                field=None,
-                details=None,
-            )
-        ],
-    )
-
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=error_response.model_dump(mode="json"),
-        headers={"X-Request-ID": request_id},
+    request_id = _get_request_id(request)
+
+    message = str(exc.detail)
+    return error_response(
+        exc.status_code,
+        message,
+        request_id,
+        [error_detail(f"HTTP_{exc.status_code}", message)],
     )
 
 
@@ -137,31 +244,23 @@ async def validation_exception_handler(
     Returns:
         JSON response with validation error details.
     """
-    request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
-
-    errors = []
-    for error in exc.errors():
-        field = ".".join(str(loc) for loc in error.get("loc", []))
-        errors.append(
-            ErrorDetail(
-                code="VALIDATION_ERROR",
-                message=error.get("msg", "Validation error"),
-                field=field if field else None,
-                details={"type": error.get("type")},
-            )
+    request_id = _get_request_id(request)
+
+    errors = [
+        error_detail(
+            "VALIDATION_ERROR",
+            error.get("msg", "Validation error"),
+            field=".".join(str(loc) for loc in error.get("loc", ())) or None,
+            details={"type": error.get("type")},
         )
-
-    error_response = ErrorResponse(
-        success=False,
-        message="Request validation failed",
-        request_id=request_id,
-        errors=errors,
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=error_response.model_dump(mode="json"),
-        headers={"X-Request-ID": request_id},
+        for error in exc.errors()
+    ]
+
+    return error_response(
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        "Request validation failed",
+        request_id,
+        errors,
     )
 
 
@@ -179,35 +278,22 @@ async def global_exception_handler(
     Returns:
         JSON response with error details.
     """
-    request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
-    settings = get_settings()
+    request_id = _get_request_id(request)
 
+    # The traceback goes to the log record only; the client gets a short summary
     logger.error(
-        f"Unhandled exception: {exc}",
-        extra={"request_id": request_id},
+        f"Unhandled exception: {exc.__class__.__name__}: {exc}",
+        extra={"request_id": request_id, "exc_type": exc.__class__.__name__},
         exc_info=True,
     )
 
-    error_details = str(exc) if settings.debug else "An unexpected error occurred"
-
-    error_response = ErrorResponse(
-        success=False,
-        message="Internal server error",
-        request_id=request_id,
-        errors=[
-            ErrorDetail(
-                code="INTERNAL_ERROR",
-                message=error_details,
-                field=None,
-                details={"traceback": traceback.format_exc()} if settings.debug else None,
-            )
-        ],
-    )
+    error_details = f"{exc.__class__.__name__}: {exc}" if _DEBUG else "An unexpected error occurred"
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump(mode="json"),
-        headers={"X-Request-ID": request_id},
+    return error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "Internal server error",
+        request_id,
+        [error_detail("INTERNAL_ERROR", error_details)],
     )
 
 
@@ -0,0 +1,79 @@
+"""
+Request body size limiting middleware.
+"""
+
+import logging
+
+from fastapi import status
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.middleware.error_handler import error_detail, error_response, new_request_id
+
+logger = logging.getLogger(__name__)
+
+_HDR_CONTENT_LENGTH = b"content-length"
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Reject requests whose declared Content-Length exceeds a limit.
+
+    The check runs on the headers alone, before the multipart parser spools
+    the body, so an oversize upload costs a few hundred bytes of I/O rather
+    than the whole file. Per-file limits are still enforced after parsing.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The next ASGI application in the chain.
+            max_body_bytes: Largest request body accepted, in bytes.
+        """
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Check the declared body size and reject oversize requests with 413.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = next(
+            (value for name, value in scope["headers"] if name == _HDR_CONTENT_LENGTH),
+            None,
+        )
+        if content_length is None or not content_length.isdigit():
+            await self.app(scope, receive, send)
+            return
+
+        if int(content_length) <= self.max_body_bytes:
+            await self.app(scope, receive, send)
+            return
+
+        logger.warning(
+            f"Rejected {scope['method']} {scope['path']}: body of {int(content_length)} bytes "
+            f"exceeds {self.max_body_bytes}"
+        )
+        request_id = scope.get("state", {}).get("request_id") or new_request_id()
+        max_mb = self.max_body_bytes / (1024 * 1024)
+        response = error_response(
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            "Request body too large",
+            request_id,
+            [
+                error_detail(
+                    "REQUEST_TOO_LARGE",
+                    f"Request body exceeds maximum allowed ({max_mb:.2f} MB)",
+                )
+            ],
+        )
+        await response(scope, receive, send)
@@ -1,47 +1,94 @@
 """
 Pydantic models for request/response validation.
+
+Re-exports are resolved lazily (PEP 562) so importing one submodule, e.g.
+``app.models.common``, does not build every request and response model.
 """
 
-from app.models.common import (
-    BaseResponse,
-    ErrorDetail,
-    ErrorResponse,
-    HealthResponse,
-    PaginatedResponse,
-    User,
-)
-from app.models.enums import (
-    ColorFormat,
-    ContrastRating,
-    ImageFormat,
-    ValidationStatus,
-    ValidationType,
-    WCAGLevel,
-    WCAGVersion,
-)
-from app.models.requests import (
-    BrandCompareImagesRequest,
-    BrandExtractColorsRequest,
-    BrandValidateImageRequest,
-    ColorCompareRequest,
-    ValidationRerunRequest,
-    WCAGValidateImageRequest,
-    WCAGValidateTextContrastRequest,
-)
-from app.models.responses import (
-    BrandValidationResponse,
-    ColorCompareResponse,
-    ColorRecommendation,
-    ExtractedColorsResponse,
-    ImageComparisonResponse,
-    SupportedFormatsResponse,
-    ValidationDetailResponse,
-    ValidationHistoryResponse,
-    ValidationRerunResponse,
-    WCAGRequirementsResponse,
-    WCAGTextContrastResponse,
-    WCAGValidationResponse,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.models.common import (
+        BaseResponse,
+        ErrorDetail,
+        ErrorResponse,
+        HealthResponse,
+        HexColor,
+        PaginatedResponse,
+        User,
+    )
+    from app.models.enums import (
+        ColorFormat,
+        ContrastRating,
+        ImageFormat,
+        ValidationStatus,
+        ValidationType,
+        WCAGLevel,
+        WCAGVersion,
+    )
+    from app.models.requests import (
+        BrandCompareImagesRequest,
+        BrandExtractColorsRequest,
+        BrandValidateImageRequest,
+        ColorCompareRequest,
+        ValidationRerunRequest,
+        WCAGValidateImageRequest,
+        WCAGValidateTextContrastRequest,
+    )
+    from app.models.responses import (
+        BrandValidationResponse,
+        ColorCompareResponse,
+        ColorRecommendation,
+        ExtractedColorsResponse,
+        ImageComparisonResponse,
+        SupportedFormatsResponse,
+        ValidationDetailResponse,
+        ValidationHistoryResponse,
+        ValidationRerunResponse,
+        WCAGIssuesPage,
+        WCAGRequirementsResponse,
+        WCAGTextContrastResponse,
+        WCAGValidationResponse,
+    )
+
+# Public name -> submodule that defines it
+_LAZY: dict[str, str] = {
+    "BaseResponse": "common",
+    "ErrorDetail": "common",
+    "ErrorResponse": "common",
+    "HealthResponse": "common",
+    "HexColor": "common",
+    "PaginatedResponse": "common",
+    "User": "common",
+    "ColorFormat": "enums",
+    "ContrastRating": "enums",
+    "ImageFormat": "enums",
+    "ValidationStatus": "enums",
+    "ValidationType": "enums",
+    "WCAGLevel": "enums",
+    "WCAGVersion": "enums",
+    "BrandCompareImagesRequest": "requests",
+    "BrandExtractColorsRequest": "requests",
+    "BrandValidateImageRequest": "requests",
+    "ColorCompareRequest": "requests",
+    "ValidationRerunRequest": "requests",
+    "WCAGValidateImageRequest": "requests",
+    "WCAGValidateTextContrastRequest": "requests",
+    "BrandValidationResponse": "responses",
+    "ColorCompareResponse": "responses",
+    "ColorRecommendation": "responses",
+    "ExtractedColorsResponse": "responses",
+    "ImageComparisonResponse": "responses",
+    "SupportedFormatsResponse": "responses",
+    "ValidationDetailResponse": "responses",
+    "ValidationHistoryResponse": "responses",
+    "ValidationRerunResponse": "responses",
+    "WCAGIssuesPage": "responses",
+    "WCAGRequirementsResponse": "responses",
+    "WCAGTextContrastResponse": "responses",
+    "WCAGValidationResponse": "responses",
+}
 
 __all__ = [
     # Common
@@ -50,6 +97,7 @@ __all__ = [
     "ErrorResponse",
     "PaginatedResponse",
     "HealthResponse",
+    "HexColor",
     "User",
     # Enums
     "ValidationStatus",
@@ -76,8 +124,25 @@ __all__ = [
     "WCAGValidationResponse",
     "WCAGTextContrastResponse",
     "WCAGRequirementsResponse",
+    "WCAGIssuesPage",
     "ValidationHistoryResponse",
     "ValidationDetailResponse",
     "ValidationRerunResponse",
     "SupportedFormatsResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names in ``dir()``."""
+    return sorted(set(globals()) | set(__all__))
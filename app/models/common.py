@@ -2,31 +2,42 @@
 Common Pydantic models used across the application.
 """
 
-from datetime import datetime
-from typing import Any, Generic, TypeVar
+from datetime import UTC, datetime
+from typing import Annotated, Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+from pydantic.dataclasses import dataclass
 
 T = TypeVar("T")
 
+# Shared "#RRGGBB" type; reusing one alias keeps a single compiled pattern in pydantic-core
+HexColor = Annotated[str, StringConstraints(pattern=r"^#[0-9A-Fa-f]{6}$")]
+
+
+def utcnow() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime."""
+    return datetime.now(UTC)
+
 
 class BaseResponse(BaseModel):
     """Base response model with common fields."""
 
+    # Responses are built once and only serialized afterwards
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(..., description="Whether the request was successful")
     message: str = Field(..., description="Human-readable message")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Response timestamp",
     )
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
 class ErrorDetail(BaseModel):
     """Detailed error information."""
 
+    model_config = ConfigDict(frozen=True)
+
     code: str = Field(..., description="Error code")
     message: str = Field(..., description="Error message")
     field: str | None = Field(None, description="Field that caused the error")
@@ -75,25 +86,26 @@ class User(BaseModel):
     permissions: list[str] = Field(default_factory=list, description="User permissions")
 
 
-class Color(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Color:
     """Color representation model."""
 
-    hex: str = Field(
-        ..., description="Hex color code (e.g., #FF5733)", pattern=r"^#[0-9A-Fa-f]{6}$"
-    )
+    hex: HexColor = Field(..., description="Hex color code (e.g., #FF5733)")
     rgb: dict[str, int] | None = Field(None, description="RGB values")
     hsl: dict[str, float] | None = Field(None, description="HSL values")
     name: str | None = Field(None, description="Color name if identified")
 
 
-class ColorPair(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ColorPair:
     """A pair of colors for contrast analysis."""
 
     foreground: Color = Field(..., description="Foreground color")
     background: Color = Field(..., description="Background color")
 
 
-class BoundingBox(BaseModel):
+@dataclass(frozen=True, slots=True)
+class BoundingBox:
     """Bounding box coordinates for detected elements."""
 
     x: int = Field(..., description="X coordinate")
@@ -102,7 +114,8 @@ class BoundingBox(BaseModel):
     height: int = Field(..., description="Height in pixels")
 
 
-class ImageMetadata(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ImageMetadata:
     """Metadata for uploaded images."""
 
     filename: str = Field(..., description="Original filename")
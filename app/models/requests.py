@@ -2,17 +2,26 @@
 Request models for API endpoints.
 """
 
-from typing import Any
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, FailFast, Field
 
-from app.models.enums import ColorFormat, WCAGLevel, WCAGVersion
+from app.models.common import HexColor
+from app.models.enums import WCAGLevel, WCAGVersion
+
+ComparisonType = Literal["visual", "colors", "layout"]
+SortOrder = Literal["asc", "desc"]
+# Mirrors ColorFormat's values; a str enum compares equal, so ColorFormat.HEX == "hex"
+ColorFormatValue = Literal["hex", "rgb", "rgba", "hsl", "hsla"]
+
+# Stops at the first bad entry instead of validating (and reporting) the whole list
+HexColorList = Annotated[list[HexColor], FailFast()]
 
 
 class ColorCompareRequest(BaseModel):
     """Request model for color contrast comparison."""
 
-    colors: list[str] = Field(
+    colors: HexColorList = Field(
         ...,
         description="List of colors in hex format (min 2, max 5)",
         min_length=2,
@@ -20,23 +29,11 @@ class ColorCompareRequest(BaseModel):
         examples=[["#FFFFFF", "#000000"]],
     )
 
-    @field_validator("colors")
-    @classmethod
-    def validate_colors(cls, v: list[str]) -> list[str]:
-        """Validate color format."""
-        import re
-
-        hex_pattern = re.compile(r"^#[0-9A-Fa-f]{6}$")
-        for color in v:
-            if not hex_pattern.match(color):
-                raise ValueError(f"Invalid hex color format: {color}")
-        return v
-
 
 class BrandValidateImageRequest(BaseModel):
     """Request model for brand image validation."""
 
-    brand_colors: list[str] = Field(
+    brand_colors: HexColorList = Field(
         ...,
         min_length=1,
         description="List of brand colors in hex format",
@@ -59,23 +56,11 @@ class BrandValidateImageRequest(BaseModel):
         default=False,
         description="Generate heatmap overlay showing on-brand vs off-brand areas",
     )
-    additional_rules: dict[str, Any] | None = Field(
+    additional_rules: Any | None = Field(
         None,
         description="Additional brand validation rules",
     )
 
-    @field_validator("brand_colors")
-    @classmethod
-    def validate_brand_colors(cls, v: list[str]) -> list[str]:
-        """Validate brand colors format."""
-        import re
-
-        hex_pattern = re.compile(r"^#[0-9A-Fa-f]{6}$")
-        for color in v:
-            if not hex_pattern.match(color):
-                raise ValueError(f"Invalid hex color format: {color}")
-        return v
-
 
 class BrandExtractColorsRequest(BaseModel):
     """Request model for color extraction from image."""
@@ -90,8 +75,8 @@ class BrandExtractColorsRequest(BaseModel):
         default=True,
         description="Include color usage percentages",
     )
-    color_format: ColorFormat = Field(
-        default=ColorFormat.HEX,
+    color_format: ColorFormatValue = Field(
+        default="hex",
         description="Output color format",
     )
     group_similar: bool = Field(
@@ -109,7 +94,7 @@ class BrandExtractColorsRequest(BaseModel):
 class BrandCompareImagesRequest(BaseModel):
     """Request model for comparing two images."""
 
-    comparison_type: str = Field(
+    comparison_type: ComparisonType = Field(
         default="visual",
         description="Type of comparison (visual, colors, layout)",
     )
@@ -160,20 +145,24 @@ class WCAGValidateImageRequest(BaseModel):
         default=True,
         description="Include accessibility improvement suggestions",
     )
+    issues_limit: int = Field(
+        default=100,
+        ge=1,
+        le=500,
+        description="Maximum number of issues to return",
+    )
 
 
 class WCAGValidateTextContrastRequest(BaseModel):
     """Request model for WCAG text contrast validation."""
 
-    foreground_color: str = Field(
+    foreground_color: HexColor = Field(
         ...,
         description="Text color in hex format",
-        pattern=r"^#[0-9A-Fa-f]{6}$",
     )
-    background_color: str = Field(
+    background_color: HexColor = Field(
         ...,
         description="Background color in hex format",
-        pattern=r"^#[0-9A-Fa-f]{6}$",
     )
     text_size_px: float | None = Field(
         None,
@@ -216,4 +205,4 @@ class ValidationHistoryParams(BaseModel):
     start_date: str | None = Field(None, description="Filter by start date (ISO format)")
     end_date: str | None = Field(None, description="Filter by end date (ISO format)")
     sort_by: str = Field(default="created_at", description="Field to sort by")
-    sort_order: str = Field(default="desc", description="Sort order (asc/desc)")
+    sort_order: SortOrder = Field(default="desc", description="Sort order (asc/desc)")
@@ -16,6 +16,11 @@ from app.models.enums import (
 )
 
 
+def _is_none(value: Any) -> bool:
+    """Field exclude_if predicate that drops unset optional payloads."""
+    return value is None
+
+
 # Color Contrast Responses
 class ColorRecommendation(BaseModel):
     """Recommended color adjustment."""
@@ -88,9 +93,13 @@ class BrandValidationResponse(BaseResponse):
         ...,
         description="Top 3 detected colors with their nearest brand color matches",
     )
-    heatmap_image: str | None = Field(
+    heatmap_url: str | None = Field(
         None,
-        description="Base64-encoded PNG heatmap overlay (green=on-brand, red=off-brand). Only included if requested.",
+        exclude_if=_is_none,
+        description=(
+            "URL of the PNG heatmap overlay (green=on-brand, red=off-brand). "
+            "Only included if requested."
+        ),
     )
     image_metadata: ImageMetadata = Field(..., description="Image metadata")
     processed_at: datetime = Field(..., description="Processing timestamp")
@@ -158,13 +167,28 @@ class WCAGValidationResponse(BaseResponse):
     is_compliant: bool = Field(..., description="Whether image is WCAG compliant")
     compliance_score: float = Field(..., description="Compliance score (0-100)")
     wcag_level_achieved: WCAGLevel = Field(..., description="Highest level achieved")
-    issues: list[WCAGIssue] = Field(..., description="List of WCAG issues found")
+    issues: list[WCAGIssue] = Field(..., description="Requested page of WCAG issues found")
+    issues_total: int = Field(..., description="Total number of issues found")
+    issues_truncated: bool = Field(
+        ..., description="Whether issues holds only part of the issues found"
+    )
     passed_criteria: list[str] = Field(..., description="List of passed criteria")
     suggestions: list[str] = Field(..., description="Improvement suggestions")
     image_metadata: ImageMetadata = Field(..., description="Image metadata")
     processed_at: datetime = Field(..., description="Processing timestamp")
 
 
+class WCAGIssuesPage(BaseResponse):
+    """Paginated WCAG issues for a previous image validation."""
+
+    validation_id: str = Field(..., description="Validation ID")
+    items: list[WCAGIssue] = Field(..., description="WCAG issues on this page")
+    total: int = Field(..., description="Total number of issues")
+    page: int = Field(..., description="Current page")
+    page_size: int = Field(..., description="Items per page")
+    total_pages: int = Field(..., description="Total pages")
+
+
 class WCAGTextContrastResponse(BaseResponse):
     """Response for WCAG text contrast validation."""
 
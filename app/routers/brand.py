@@ -2,10 +2,12 @@
 Brand validation endpoints.
 """
 
+import asyncio
 import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, Form, UploadFile, status
+from pydantic import TypeAdapter, ValidationError
 
 from app.dependencies import get_brand_service_dep, get_current_user
 from app.models.common import User
@@ -13,6 +15,7 @@ from app.models.requests import (
     BrandCompareImagesRequest,
     BrandExtractColorsRequest,
     BrandValidateImageRequest,
+    ComparisonType,
 )
 from app.models.responses import (
     BrandValidationResponse,
@@ -20,10 +23,13 @@ from app.models.responses import (
     ImageComparisonResponse,
 )
 from app.services.brand_service import BrandService
-from app.utils.file_validation import validate_image_file
+from app.utils.file_validation import read_image_upload
 
 logger = logging.getLogger(__name__)
 
+# Built once at import; parses and type-checks a JSON brand_colors array in one pass
+_BRAND_COLORS_JSON = TypeAdapter(list[str])
+
 router = APIRouter(
     prefix="/brand",
     tags=["Brand Validation"],
@@ -51,12 +57,10 @@ router = APIRouter(
 
     The response includes a compliance score, detailed color matches,
     and individual validation rule results.
+
+    When a heatmap is requested, `heatmap_url` points at the PNG overlay,
+    which is fetched separately.
     """,
-    responses={
-        200: {
-            "description": "Successful brand validation",
-        },
-    },
 )
 async def validate_image(
     image: Annotated[UploadFile, File(description="Image file to validate")],
@@ -86,32 +90,31 @@ async def validate_image(
     Returns:
         BrandValidationResponse with validation results.
     """
-    # Validate file
-    await validate_image_file(image)
+    # Validate file and read it once
+    upload = await read_image_upload(image)
 
     # Parse brand colors - handle both comma-separated and JSON array formats
-    import json
-
-    logger.info(f"Received brand_colors: {brand_colors}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Received brand_colors: {brand_colors}")
 
     # Strip surrounding quotes if present (form data sometimes includes them)
     clean_brand_colors = brand_colors.strip().strip('"').strip("'")
 
+    # Only input that looks like a JSON array goes through the JSON parser, so the
+    # common comma-separated form never raises and catches a ValidationError
     parsed_colors = None
-    try:
-        # Try parsing as JSON array first
-        maybe_parsed = json.loads(clean_brand_colors)
-        # Only use JSON result if it's actually a list
-        if isinstance(maybe_parsed, list):
-            parsed_colors = maybe_parsed
-    except json.JSONDecodeError:
-        pass
+    if clean_brand_colors.startswith("["):
+        try:
+            parsed_colors = _BRAND_COLORS_JSON.validate_json(clean_brand_colors)
+        except ValidationError:
+            pass
 
     # Fall back to comma-separated string
     if parsed_colors is None:
-        parsed_colors = [c.strip() for c in clean_brand_colors.split(",")]
+        parsed_colors = [c.strip() for c in clean_brand_colors.split(",") if c.strip()]
 
-    logger.info(f"Parsed brand_colors: {parsed_colors}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Parsed brand_colors: {parsed_colors}")
 
     # Create request model
     request = BrandValidateImageRequest(
@@ -126,7 +129,7 @@ async def validate_image(
     logger.info(f"Brand validation requested by user {current_user.id}")
 
     response = await brand_service.validate_image(
-        image=image,
+        image=upload,
         request=request,
         user_id=current_user.id,
     )
@@ -181,8 +184,8 @@ async def extract_colors(
     # - Call brand service for extraction
     # - Return extracted colors
 
-    # Validate file
-    await validate_image_file(image)
+    # Validate file and read it once
+    upload = await read_image_upload(image)
 
     request = BrandExtractColorsRequest(
         max_colors=max_colors,
@@ -194,7 +197,7 @@ async def extract_colors(
     logger.info(f"Color extraction requested by user {current_user.id}")
 
     response = await brand_service.extract_colors(
-        image=image,
+        image=upload,
         request=request,
         user_id=current_user.id,
     )
@@ -227,7 +230,7 @@ async def compare_images(
     image2: Annotated[UploadFile, File(description="Second image file")],
     current_user: Annotated[User, Depends(get_current_user)],
     brand_service: Annotated[BrandService, Depends(get_brand_service_dep)],
-    comparison_type: Annotated[str, Form()] = "visual",
+    comparison_type: Annotated[ComparisonType, Form()] = "visual",
     include_color_diff: Annotated[bool, Form()] = True,
     include_layout_diff: Annotated[bool, Form()] = False,
     sensitivity: Annotated[float, Form(ge=0, le=1)] = 0.9,
@@ -253,9 +256,11 @@ async def compare_images(
     # - Call brand service for comparison
     # - Return comparison results
 
-    # Validate files
-    await validate_image_file(image1)
-    await validate_image_file(image2)
+    # Validate and read both files concurrently
+    upload1, upload2 = await asyncio.gather(
+        read_image_upload(image1),
+        read_image_upload(image2),
+    )
 
     request = BrandCompareImagesRequest(
         comparison_type=comparison_type,
@@ -267,8 +272,8 @@ async def compare_images(
     logger.info(f"Image comparison requested by user {current_user.id}")
 
     response = await brand_service.compare_images(
-        image1=image1,
-        image2=image2,
+        image1=upload1,
+        image2=upload2,
         request=request,
         user_id=current_user.id,
     )
@@ -3,7 +3,8 @@ Color contrast comparison endpoints.
 """
 
 import logging
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, status
 
@@ -15,6 +16,10 @@ from app.scripts.ColorValidation import ColorValidation
 
 logger = logging.getLogger(__name__)
 
+# ColorValidation holds no state, so one instance serves every request
+_COLOR_VALIDATOR = ColorValidation()
+PALETTE_CACHE_SIZE = 4096
+
 router = APIRouter(
     prefix="/colors",
     tags=["Color Contrast"],
@@ -26,6 +31,24 @@ router = APIRouter(
 )
 
 
+@lru_cache(maxsize=PALETTE_CACHE_SIZE)
+def _compare_palette(
+    colors: tuple[str, ...],
+) -> tuple[dict[str, dict[str, Any]], dict[str, float], float]:
+    """
+    Compare a palette, memoized since the result depends only on the colors.
+
+    Args:
+        colors: Upper-cased hex colors in request order.
+
+    Returns:
+        Tuple of (pair comparisons, per-color scores, palette score).
+    """
+    comparisons = _COLOR_VALIDATOR.colorContrastValidation(list(colors))
+    color_scores, palette_score = _COLOR_VALIDATOR.calculateScores(list(colors), comparisons)
+    return comparisons, color_scores, palette_score
+
+
 @router.post(
     "/compare",
     response_model=ColorCompareResponse,
@@ -91,10 +114,10 @@ async def compare_colors(
         f"{len(request.colors)} colors - {request.colors}"
     )
 
-    # Use ColorValidation class to get comprehensive results
-    color_validator = ColorValidation()
-    comparisons = color_validator.colorContrastValidation(request.colors)
-    color_scores, palette_score = color_validator.calculateScores(request.colors, comparisons)
+    # Repeat palettes (e.g. from color pickers) are served from the cache
+    comparisons, color_scores, palette_score = _compare_palette(
+        tuple(color.upper() for color in request.colors)
+    )
 
     return ColorCompareResponse(
         success=True,
@@ -2,19 +2,31 @@
 Utility endpoints for health checks and supported formats.
 """
 
+import asyncio
 import logging
-from typing import Annotated
+import time
+from functools import cache
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 
 from app.config import Settings, get_settings
 from app.dependencies import get_optional_user, get_redis
 from app.models.common import HealthResponse, User
 from app.models.responses import SupportedFormat, SupportedFormatsResponse
 from app.services.redis_service import RedisService
+from app.utils.static_payload import StaticPayload, static_json_response
 
 logger = logging.getLogger(__name__)
 
+# Dependency probe results, reused for settings.health_cache_ttl_seconds so that
+# load balancer polling does not cost a Redis round-trip per request
+_HEALTH_CACHE: dict[str, Any] = {"dependencies": None, "expires": 0.0}
+_HEALTH_LOCK = asyncio.Lock()
+
+# Supported formats only change with a deploy
+SUPPORTED_FORMATS_MAX_AGE = 24 * 3600
+
 router = APIRouter(
     tags=["Utilities"],
     responses={
@@ -60,6 +72,7 @@ router = APIRouter(
     },
 )
 async def health_check(
+    response: Response,
     settings: Annotated[Settings, Depends(get_settings)],
     redis: Annotated[RedisService, Depends(get_redis)],
 ) -> HealthResponse:
@@ -67,6 +80,7 @@ async def health_check(
     Check API health status.
 
     Args:
+        response: Outgoing response (for cache headers).
         settings: Application settings.
         redis: Redis service for checking connection.
 
@@ -74,23 +88,20 @@ async def health_check(
         HealthResponse with health status and dependency checks.
     """
     # TODO: Implement comprehensive health checks
-    # - Check Redis connection
     # - Check any other critical dependencies
-    # - Return aggregated health status
 
-    dependencies = {}
+    dependencies = await _get_dependency_status(
+        redis,
+        settings.health_cache_ttl_seconds,
+        settings.health_probe_timeout_seconds,
+    )
 
-    # Check Redis
-    try:
-        redis_healthy = await redis.health_check()
-        dependencies["redis"] = "healthy" if redis_healthy else "unhealthy"
-    except Exception as e:
-        logger.warning(f"Redis health check failed: {e}")
-        dependencies["redis"] = "unhealthy"
+    # Pollers may reuse the answer for as long as the probe result is reused here;
+    # no ETag since the body carries a fresh timestamp
+    response.headers["Cache-Control"] = f"max-age={int(settings.health_cache_ttl_seconds)}"
 
     # Determine overall status
-    all_healthy = all(status == "healthy" for status in dependencies.values())
-    overall_status = "healthy" if all_healthy else "degraded"
+    overall_status = "degraded" if "unhealthy" in dependencies.values() else "healthy"
 
     return HealthResponse(
         success=True,
@@ -102,6 +113,68 @@ async def health_check(
     )
 
 
+async def _get_dependency_status(
+    redis: RedisService,
+    ttl: float,
+    probe_timeout: float,
+) -> dict[str, str]:
+    """
+    Get dependency health, probing at most once per TTL window.
+
+    Args:
+        redis: Redis service for checking connection.
+        ttl: Seconds a probe result stays valid.
+        probe_timeout: Seconds each probe may take before it counts as unhealthy.
+
+    Returns:
+        Mapping of dependency name to "healthy" or "unhealthy".
+    """
+    if time.monotonic() < _HEALTH_CACHE["expires"]:
+        return _HEALTH_CACHE["dependencies"]
+
+    async with _HEALTH_LOCK:
+        # Another request may have refreshed the cache while we waited
+        if time.monotonic() < _HEALTH_CACHE["expires"]:
+            return _HEALTH_CACHE["dependencies"]
+
+        dependencies = await _check_dependencies(redis, probe_timeout)
+        _HEALTH_CACHE["dependencies"] = dependencies
+        _HEALTH_CACHE["expires"] = time.monotonic() + ttl
+        return dependencies
+
+
+async def _check_dependencies(redis: RedisService, timeout: float) -> dict[str, str]:
+    """
+    Probe every dependency concurrently, each bounded by a timeout.
+
+    Args:
+        redis: Redis service for checking connection.
+        timeout: Seconds each probe may take.
+
+    Returns:
+        Mapping of dependency name to "healthy" or "unhealthy".
+    """
+    # Each probe resolves to True when the dependency is usable
+    probes = {
+        "redis": redis.health_check(),
+    }
+
+    results = await asyncio.gather(
+        *(asyncio.wait_for(probe, timeout) for probe in probes.values()),
+        return_exceptions=True,
+    )
+
+    dependencies = {}
+    for name, result in zip(probes, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning(f"{name} health check failed: {result!r}")
+            dependencies[name] = "unhealthy"
+        else:
+            dependencies[name] = "healthy" if result else "unhealthy"
+
+    return dependencies
+
+
 @router.get(
     "/utils/supported-formats",
     response_model=SupportedFormatsResponse,
@@ -117,6 +190,9 @@ async def health_check(
     - Maximum image dimensions
 
     Use this information to validate files before upload.
+
+    The payload is static for the lifetime of the process and is served
+    with an ETag; send it back in If-None-Match to get a 304.
     """,
     responses={
         200: {
@@ -149,46 +225,65 @@ async def health_check(
                 }
             },
         },
+        304: {"description": "Client copy is current (If-None-Match matched the ETag)"},
     },
 )
 async def get_supported_formats(
-    settings: Annotated[Settings, Depends(get_settings)],
+    request: Request,
     current_user: Annotated[User | None, Depends(get_optional_user)],
-) -> SupportedFormatsResponse:
+) -> Response:
     """
     Get supported file formats and limits.
 
     Args:
-        settings: Application settings.
+        request: The incoming request (for conditional GETs).
         current_user: Optional authenticated user.
 
     Returns:
-        SupportedFormatsResponse with format details.
+        Pre-serialized SupportedFormatsResponse, or 304 if the client's copy is current.
+    """
+    return static_json_response(
+        request, _supported_formats_payload(), max_age=SUPPORTED_FORMATS_MAX_AGE
+    )
+
+
+# Format descriptions
+_FORMAT_DESCRIPTIONS = {
+    "jpg": "JPEG image format - lossy compression, good for photos",
+    "jpeg": "JPEG image format - lossy compression, good for photos",
+    "png": "PNG image format - lossless compression, supports transparency",
+    "gif": "GIF image format - supports animation, limited colors",
+    "webp": "WebP image format - modern format with good compression",
+    "svg": "SVG vector format - scalable, XML-based",
+}
+
+# MIME type mapping
+_MIME_MAPPING = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "svg": "image/svg+xml",
+}
+
+
+@cache
+def _supported_formats_payload() -> StaticPayload:
+    """
+    Build and serialize the supported formats response once per process.
+
+    The payload only depends on settings, which are themselves cached, so
+    the body and its ETag never change while the process is running.
+
+    Returns:
+        StaticPayload for SupportedFormatsResponse.
     """
     # TODO: Implement format information retrieval
     # - Build list of supported formats
     # - Include MIME types and descriptions
     # - Return size limits
-
-    # Format descriptions
-    format_descriptions = {
-        "jpg": "JPEG image format - lossy compression, good for photos",
-        "jpeg": "JPEG image format - lossy compression, good for photos",
-        "png": "PNG image format - lossless compression, supports transparency",
-        "gif": "GIF image format - supports animation, limited colors",
-        "webp": "WebP image format - modern format with good compression",
-        "svg": "SVG vector format - scalable, XML-based",
-    }
-
-    # MIME type mapping
-    mime_mapping = {
-        "jpg": "image/jpeg",
-        "jpeg": "image/jpeg",
-        "png": "image/png",
-        "gif": "image/gif",
-        "webp": "image/webp",
-        "svg": "image/svg+xml",
-    }
+    settings = get_settings()
 
     image_formats = []
     for ext in settings.allowed_image_extensions:
@@ -196,19 +291,21 @@ async def get_supported_formats(
         image_formats.append(
             SupportedFormat(
                 extension=ext_lower,
-                mime_type=mime_mapping.get(ext_lower, f"image/{ext_lower}"),
+                mime_type=_MIME_MAPPING.get(ext_lower, f"image/{ext_lower}"),
                 max_size_mb=settings.max_file_size_mb,
-                description=format_descriptions.get(ext_lower, f"{ext.upper()} image format"),
+                description=_FORMAT_DESCRIPTIONS.get(ext_lower, f"{ext.upper()} image format"),
             )
         )
 
-    return SupportedFormatsResponse(
-        success=True,
-        message="Supported formats retrieved",
-        image_formats=image_formats,
-        max_file_size_mb=settings.max_file_size_mb,
-        max_dimensions={
-            "width": 4096,  # TODO: Make configurable
-            "height": 4096,
-        },
+    return StaticPayload.from_model(
+        SupportedFormatsResponse(
+            success=True,
+            message="Supported formats retrieved",
+            image_formats=image_formats,
+            max_file_size_mb=settings.max_file_size_mb,
+            max_dimensions={
+                "width": 4096,  # TODO: Make configurable
+                "height": 4096,
+            },
+        )
     )
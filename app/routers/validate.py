@@ -5,20 +5,24 @@ Combined validation and history endpoints.
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from app.dependencies import get_current_user, get_validation_service_dep
 from app.models.common import User
-from app.models.requests import ValidationHistoryParams, ValidationRerunRequest
+from app.models.requests import SortOrder, ValidationHistoryParams, ValidationRerunRequest
 from app.models.responses import (
     ValidationDetailResponse,
     ValidationHistoryResponse,
     ValidationRerunResponse,
+    WCAGIssuesPage,
 )
 from app.services.validation_service import ValidationService
 
 logger = logging.getLogger(__name__)
 
+# Heatmaps never change once generated, so clients may cache them
+HEATMAP_CACHE_CONTROL = "private, max-age=3600"
+
 router = APIRouter(
     prefix="/validate",
     tags=["Validation History"],
@@ -63,7 +67,7 @@ async def get_history(
     ] = None,
     end_date: Annotated[str | None, Query(description="Filter by end date (ISO format)")] = None,
     sort_by: Annotated[str, Query(description="Field to sort by")] = "created_at",
-    sort_order: Annotated[str, Query(description="Sort order (asc/desc)")] = "desc",
+    sort_order: Annotated[SortOrder, Query(description="Sort order (asc/desc)")] = "desc",
 ) -> ValidationHistoryResponse:
     """
     Get validation history for the current user.
@@ -174,6 +178,130 @@ async def get_validation_detail(
         ) from e
 
 
+@router.get(
+    "/{validation_id}/heatmap.png",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    summary="Get brand validation heatmap",
+    description="""
+    Download the heatmap overlay generated by a brand image validation.
+
+    The PNG is served as raw bytes; its URL is returned as `heatmap_url`
+    by `POST /brand/validate-image` when `generate_heatmap` is set.
+    Heatmaps expire an hour after the validation.
+    """,
+    responses={
+        200: {
+            "description": "Heatmap PNG",
+            "content": {"image/png": {}},
+        },
+        404: {
+            "description": "Validation or heatmap not found",
+        },
+    },
+)
+async def get_validation_heatmap(
+    validation_id: str,
+    current_user: Annotated[User, Depends(get_current_user)],
+    validation_service: Annotated[ValidationService, Depends(get_validation_service_dep)],
+) -> Response:
+    """
+    Get the heatmap PNG for a brand validation.
+
+    Args:
+        validation_id: The unique validation ID.
+        current_user: The authenticated user.
+        validation_service: The validation service.
+
+    Returns:
+        Response with the PNG image.
+
+    Raises:
+        HTTPException: If validation or heatmap not found, or access denied.
+    """
+    try:
+        heatmap = await validation_service.get_heatmap(
+            validation_id=validation_id,
+            user_id=current_user.id,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "code": "HEATMAP_NOT_FOUND",
+                "message": str(e),
+            },
+        ) from e
+
+    return Response(
+        content=heatmap,
+        media_type="image/png",
+        headers={"Cache-Control": HEATMAP_CACHE_CONTROL},
+    )
+
+
+@router.get(
+    "/{validation_id}/issues",
+    response_model=WCAGIssuesPage,
+    status_code=status.HTTP_200_OK,
+    summary="Get WCAG validation issues",
+    description="""
+    Page through the full issue list of a WCAG image validation.
+
+    Every `POST /wcag/validate-image` stores its full issue list, whether or
+    not the response reported `issues_truncated`; validations with no issues
+    return an empty page. Stored issues expire an hour after the validation,
+    after which this endpoint returns 404.
+    """,
+    responses={
+        200: {
+            "description": "Page of WCAG issues",
+        },
+        404: {
+            "description": "Validation or issues not found",
+        },
+    },
+)
+async def get_validation_issues(
+    validation_id: str,
+    current_user: Annotated[User, Depends(get_current_user)],
+    validation_service: Annotated[ValidationService, Depends(get_validation_service_dep)],
+    page: Annotated[int, Query(ge=1, description="Page number")] = 1,
+    page_size: Annotated[int, Query(ge=1, le=500, description="Issues per page")] = 100,
+) -> WCAGIssuesPage:
+    """
+    Get a page of WCAG issues for an image validation.
+
+    Args:
+        validation_id: The unique validation ID.
+        current_user: The authenticated user.
+        validation_service: The validation service.
+        page: Page number.
+        page_size: Issues per page.
+
+    Returns:
+        WCAGIssuesPage with the requested issues.
+
+    Raises:
+        HTTPException: If validation or issues not found, or access denied.
+    """
+    try:
+        return await validation_service.get_issues(
+            validation_id=validation_id,
+            user_id=current_user.id,
+            page=page,
+            page_size=page_size,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "code": "ISSUES_NOT_FOUND",
+                "message": str(e),
+            },
+        ) from e
+
+
 @router.post(
     "/{validation_id}/rerun",
     response_model=ValidationRerunResponse,
@@ -5,7 +5,7 @@ WCAG accessibility validation endpoints.
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Query, Request, Response, UploadFile, status
 
 from app.dependencies import get_current_user, get_wcag_service_dep
 from app.models.common import User
@@ -17,10 +17,14 @@ from app.models.responses import (
     WCAGValidationResponse,
 )
 from app.services.wcag_service import WCAGService
-from app.utils.file_validation import validate_image_file
+from app.utils.file_validation import read_image_upload
+from app.utils.static_payload import StaticPayload, static_json_response
 
 logger = logging.getLogger(__name__)
 
+# Requirements only vary by (version, level); each combination is serialized once
+_REQUIREMENTS_PAYLOADS: dict[tuple[WCAGVersion, WCAGLevel | None], StaticPayload] = {}
+
 router = APIRouter(
     prefix="/wcag",
     tags=["WCAG Validation"],
@@ -49,6 +53,10 @@ router = APIRouter(
 
     The response includes a compliance score, specific issues found,
     and suggestions for improvement.
+
+    At most `issues_limit` issues are returned; `issues_truncated` is set when
+    more were found. The full list is available from
+    `GET /validate/{validation_id}/issues` for an hour.
     """,
     responses={
         200: {
@@ -67,6 +75,7 @@ async def validate_image(
     check_text_size: Annotated[bool, Form()] = True,
     check_touch_targets: Annotated[bool, Form()] = False,
     include_suggestions: Annotated[bool, Form()] = True,
+    issues_limit: Annotated[int, Form(ge=1, le=500)] = 100,
 ) -> WCAGValidationResponse:
     """
     Validate an image for WCAG accessibility compliance.
@@ -82,6 +91,7 @@ async def validate_image(
         check_text_size: Whether to check text size requirements.
         check_touch_targets: Whether to check touch target sizes.
         include_suggestions: Whether to include improvement suggestions.
+        issues_limit: Maximum number of issues to return.
 
     Returns:
         WCAGValidationResponse with accessibility validation results.
@@ -92,8 +102,8 @@ async def validate_image(
     # - Store validation result for history
     # - Return response with issues and suggestions
 
-    # Validate file
-    await validate_image_file(image)
+    # Validate file and read it once
+    upload = await read_image_upload(image)
 
     request = WCAGValidateImageRequest(
         wcag_version=wcag_version,
@@ -103,6 +113,7 @@ async def validate_image(
         check_text_size=check_text_size,
         check_touch_targets=check_touch_targets,
         include_suggestions=include_suggestions,
+        issues_limit=issues_limit,
     )
 
     logger.info(
@@ -111,7 +122,7 @@ async def validate_image(
     )
 
     response = await wcag_service.validate_image(
-        image=image,
+        image=upload,
         request=request,
         user_id=current_user.id,
     )
@@ -211,25 +222,28 @@ async def validate_text_contrast(
         200: {
             "description": "WCAG requirements retrieved successfully",
         },
+        304: {"description": "Client copy is current (If-None-Match matched the ETag)"},
     },
 )
 async def get_requirements(
+    request: Request,
     current_user: Annotated[User, Depends(get_current_user)],
     wcag_service: Annotated[WCAGService, Depends(get_wcag_service_dep)],
     version: Annotated[WCAGVersion, Query()] = WCAGVersion.WCAG_21,
     level: Annotated[WCAGLevel | None, Query()] = None,
-) -> WCAGRequirementsResponse:
+) -> Response:
     """
     Get WCAG requirements and success criteria.
 
     Args:
+        request: The incoming request (for conditional GETs).
         current_user: The authenticated user.
         wcag_service: The WCAG validation service.
         version: WCAG version to get requirements for.
         level: Optional filter by conformance level.
 
     Returns:
-        WCAGRequirementsResponse with list of criteria.
+        Pre-serialized WCAGRequirementsResponse, or 304 if the client's copy is current.
     """
     # TODO: Implement WCAG requirements retrieval
     # - Load criteria for version
@@ -241,9 +255,15 @@ async def get_requirements(
         f"version={version.value}, level={level.value if level else 'all'}"
     )
 
-    response = wcag_service.get_requirements(
-        version=version,
-        level=level,
-    )
-
-    return response
+    payload = _REQUIREMENTS_PAYLOADS.get((version, level))
+    if payload is None:
+        payload = StaticPayload.from_model(
+            wcag_service.get_requirements(
+                version=version,
+                level=level,
+            )
+        )
+        _REQUIREMENTS_PAYLOADS[(version, level)] = payload
+
+    # Requires authentication, so only the client may cache it
+    return static_json_response(request, payload, private=True)
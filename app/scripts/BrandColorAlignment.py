@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import base64
-import math
 from dataclasses import dataclass
 from typing import Any
 
@@ -14,6 +12,10 @@ import numpy as np
 
 MAX_IMAGE_SIDE = 512  # max side length when resizing
 DEFAULT_K_CLUSTERS = 8
+KMEANS_SAMPLE_STRIDE = 4  # fit k-means on every Nth pixel; Lab is locally smooth
+KMEANS_MIN_SAMPLE_PIXELS = 4096  # below this many sampled pixels, fit on all of them
+KMEANS_MAX_SAMPLE_PIXELS = 30_000  # enough to place k <= 16 centers; caps the fit cost
+KMEANS_LABEL_TILE = 65_536  # pixels labeled per pass, bounds the (tile, k) score matrix
 
 MAX_LAB_DISTANCE = 35.0  # max distance considered "in-range"
 NEUTRAL_CHROMA_THRESHOLD = 8  # chroma below this = neutral (white/gray-ish)
@@ -43,10 +45,12 @@ class BrandColorSpec:
 
 
 @dataclass
-class _BrandColor:
-    hex: str
-    lab: np.ndarray  # shape (3,) in OpenCV Lab space
-    is_neutral: bool  # based on chroma
+class _BrandPalette:
+    """Brand colors stored as parallel arrays so distances are one broadcast."""
+
+    hexes: list[str]
+    lab: np.ndarray  # shape (N, 3) uint8 in OpenCV Lab space
+    is_neutral: np.ndarray  # shape (N,) bool, based on chroma
 
 
 # =========================
@@ -57,34 +61,47 @@ class _BrandColor:
 def _hex_to_rgb(hex_str: str) -> tuple[int, int, int]:
     s = hex_str.strip().lstrip("#")
     if len(s) == 3:
-        s = "".join([c * 2 for c in s])
+        s = s[0] * 2 + s[1] * 2 + s[2] * 2
+    # bytes.fromhex validates and decodes in one C pass; it also skips spaces,
+    # so the length check on s is still needed
     if len(s) != 6:
         raise ValueError(f"Invalid hex color: {hex_str}")
-    if any(c not in "0123456789abcdefABCDEF" for c in s):
+    try:
+        rgb = bytes.fromhex(s)
+    except ValueError:
+        raise ValueError(f"Invalid hex color: {hex_str}") from None
+    if len(rgb) != 3:
         raise ValueError(f"Invalid hex color: {hex_str}")
-    r = int(s[0:2], 16)
-    g = int(s[2:4], 16)
-    b = int(s[4:6], 16)
-    return r, g, b
+    return rgb[0], rgb[1], rgb[2]
 
 
-def _rgb_to_lab_opencv(rgb: tuple[int, int, int]) -> np.ndarray:
-    """Convert RGB triple (0-255) to Lab using OpenCV."""
-    r, g, b = rgb
-    bgr_pixel = np.array([[[b, g, r]]], dtype=np.uint8)  # OpenCV uses BGR
-    lab_pixel = cv2.cvtColor(bgr_pixel, cv2.COLOR_BGR2LAB)
-    return np.array(lab_pixel[0, 0], dtype=np.float32)  # shape (3,)
+def _hexes_to_lab_batch(hex_list: list[str]) -> np.ndarray:
+    """Convert hex colors to Lab with a single OpenCV call; returns (N, 3) uint8."""
+    rgb = np.array([_hex_to_rgb(h) for h in hex_list], dtype=np.uint8)  # (N,3)
+    bgr = np.ascontiguousarray(rgb[:, ::-1]).reshape(-1, 1, 3)  # OpenCV uses BGR
+    lab = cv2.cvtColor(bgr, cv2.COLOR_BGR2LAB)
+    return lab.reshape(-1, 3)
 
 
-def _chroma_from_lab(lab: np.ndarray) -> float:
-    a = float(lab[1])
-    b = float(lab[2])
-    return math.sqrt(a * a + b * b)
+def _is_neutral_lab(lab: np.ndarray) -> np.ndarray:
+    """Neutral mask for (..., 3) uint8 OpenCV Lab values (a/b stored offset by 128)."""
+    a = lab[..., 1].astype(np.int32) - 128
+    b = lab[..., 2].astype(np.int32) - 128
+    # Compare squared chroma so no sqrt is needed
+    return a * a + b * b < NEUTRAL_CHROMA_THRESHOLD * NEUTRAL_CHROMA_THRESHOLD
 
 
 def _resize_image_keep_aspect(bgr: np.ndarray, max_side: int) -> np.ndarray:
+    if max(bgr.shape[:2]) <= max_side:
+        return bgr
+
+    # Halve with pyrDown (SIMD blur + decimate) while still at least 2x too large,
+    # then finish with a single INTER_AREA resize
+    while max(bgr.shape[:2]) >= 2 * max_side:
+        bgr = cv2.pyrDown(bgr)
+
     h, w = bgr.shape[:2]
-    scale = min(1.0, float(max_side) / float(max(h, w)))
+    scale = float(max_side) / float(max(h, w))
     if scale >= 0.999:
         return bgr
     new_w = int(round(w * scale))
@@ -127,7 +144,7 @@ class BrandColorAnalyzer:
         :param brand_colors: list of BrandColorSpec (hex only)
         :param k_clusters: k-means cluster count (3–16)
         :param generate_heatmap: if True, generate a heatmap overlay image
-        :return: dict with alignment_score, brand_color_coverage, debug, heatmap_base64, etc.
+        :return: dict with alignment_score, brand_color_coverage, debug, heatmap_png, etc.
         """
         if not isinstance(bgr_image, np.ndarray):
             raise TypeError("bgr_image must be a NumPy array")
@@ -139,7 +156,7 @@ class BrandColorAnalyzer:
             raise ValueError("k_clusters must be between 3 and 16")
 
         palette = self._build_palette(brand_colors)
-        has_neutral_brand = any(c.is_neutral for c in palette)
+        has_neutral_brand = bool(palette.is_neutral.any())
 
         # 1) Preprocess image
         bgr = self._ensure_3_channel_bgr(bgr_image)
@@ -152,65 +169,51 @@ class BrandColorAnalyzer:
         # 2) K-means clustering in Lab space
         centers, labels, coverage = self._kmeans_clusters(lab_image, k_clusters)
 
-        # 3) Compute distances from each cluster center to each brand color
-        centers_expanded = centers[:, np.newaxis, :]  # (k,1,3)
-        brand_labs = np.stack([c.lab for c in palette], axis=0)  # (B,3)
-        brand_labs_expanded = brand_labs[np.newaxis, :, :]  # (1,B,3)
-
-        # distances: (k, B)
-        dists = np.linalg.norm(centers_expanded - brand_labs_expanded, axis=2)
+        # 3) Squared distances from each cluster center to each brand color: (k, B)
+        # Lab fits in uint8, so deltas fit in int16 and squared sums in int32
+        centers_u8 = np.clip(np.rint(centers), 0, 255).astype(np.uint8)  # (k,3)
+        diff = np.subtract(
+            centers_u8[:, np.newaxis, :], palette.lab[np.newaxis, :, :], dtype=np.int16
+        )
+        sq_dists = np.square(diff, dtype=np.int32).sum(axis=2)  # 255**2 overflows int16
 
-        nearest_brand_indices = np.argmin(dists, axis=1)  # (k,)
-        min_dists = dists[np.arange(dists.shape[0]), nearest_brand_indices]  # (k,)
+        nearest_brand_indices = np.argmin(sq_dists, axis=1)  # (k,)
+        # Only the k nearest distances need a sqrt
+        min_dists = np.sqrt(sq_dists[np.arange(k_clusters), nearest_brand_indices])  # (k,) float64
 
         max_d = max(self.max_lab_distance, 1e-6)
 
-        B = len(palette)
-        raw_coverage_brand = np.zeros(B, dtype=np.float64)
-        adjusted_coverage_brand = np.zeros(B, dtype=np.float64)
-        distance_sums_brand = np.zeros(B, dtype=np.float64)
-        distance_counts_brand = np.zeros(B, dtype=np.float64)
-
-        overall_score = 0.0
-
-        for i in range(k_clusters):
-            cluster_center_lab = centers[i]
-            cluster_cov = float(coverage[i])
-            if cluster_cov <= 0:
-                continue
-
-            brand_idx = int(nearest_brand_indices[i])
-            brand = palette[brand_idx]
-            dist = float(min_dists[i])
+        # closeness in [0,1]
+        closeness = np.maximum(0.0, 1.0 - min_dists / max_d)
 
-            # closeness in [0,1]
-            closeness = max(0.0, 1.0 - (dist / max_d))
-
-            # neutral handling
-            cluster_chroma = _chroma_from_lab(cluster_center_lab)
-            cluster_is_neutral = cluster_chroma < NEUTRAL_CHROMA_THRESHOLD
-
-            neutral_multiplier = 1.0
-            if cluster_is_neutral and not has_neutral_brand:
-                neutral_multiplier = NEUTRAL_PENALTY_WHEN_NO_NEUTRALS
+        # neutral handling: down-weight neutral clusters when the brand has no neutrals
+        cluster_is_neutral = _is_neutral_lab(centers_u8)
+        neutral_multiplier = np.where(
+            cluster_is_neutral & (not has_neutral_brand),
+            NEUTRAL_PENALTY_WHEN_NO_NEUTRALS,
+            1.0,
+        )
 
-            # contribution to global score
-            # (no brand.weight anymore — all colors are equally important)
-            cluster_score = cluster_cov * closeness * neutral_multiplier
-            overall_score += cluster_score
+        # contribution to global score
+        # (no brand.weight anymore — all colors are equally important)
+        active = coverage > 0
+        nearest = nearest_brand_indices[active]
+        cluster_scores = (coverage * closeness * neutral_multiplier)[active]
+        overall_score = float(cluster_scores.sum())
 
-            # brand-wise aggregations
-            raw_coverage_brand[brand_idx] += cluster_cov
-            adjusted_coverage_brand[brand_idx] += cluster_cov * closeness * neutral_multiplier
-            distance_sums_brand[brand_idx] += dist
-            distance_counts_brand[brand_idx] += 1.0
+        # brand-wise aggregations
+        B = len(palette.hexes)
+        raw_coverage_brand = np.bincount(nearest, weights=coverage[active], minlength=B)
+        adjusted_coverage_brand = np.bincount(nearest, weights=cluster_scores, minlength=B)
+        distance_sums_brand = np.bincount(nearest, weights=min_dists[active], minlength=B)
+        distance_counts_brand = np.bincount(nearest, minlength=B)
 
         # overall_score ∈ [0,1] (modulo neutral penalties), so map to 0–100
         alignment_score = float(round(overall_score * 100.0, 2))
 
         # per-brand breakdown
         brand_coverage_list = []
-        for idx, brand in enumerate(palette):
+        for idx, brand_hex in enumerate(palette.hexes):
             raw_cov_pct = float(round(raw_coverage_brand[idx] * 100.0, 2))
             adj_cov_pct = float(round(adjusted_coverage_brand[idx] * 100.0, 2))
             if distance_counts_brand[idx] > 0:
@@ -220,7 +223,7 @@ class BrandColorAnalyzer:
 
             brand_coverage_list.append(
                 {
-                    "hex": brand.hex,
+                    "hex": brand_hex,
                     "raw_coverage_percent": raw_cov_pct,
                     "adjusted_coverage_percent": adj_cov_pct,
                     "avg_distance": avg_dist,
@@ -236,7 +239,6 @@ class BrandColorAnalyzer:
 
             cluster_center_lab = centers[i]
             brand_idx = int(nearest_brand_indices[i])
-            brand = palette[brand_idx]
             dist = float(min_dists[i])
 
             # Convert cluster center back to hex
@@ -248,7 +250,7 @@ class BrandColorAnalyzer:
             detected_colors_list.append(
                 {
                     "detected_color": cluster_hex,
-                    "nearest_brand_color": brand.hex,
+                    "nearest_brand_color": palette.hexes[brand_idx],
                     "match_percentage": round(match_pct, 1),
                     "coverage_percentage": round(cluster_cov * 100.0, 1),
                     "distance": dist,
@@ -274,29 +276,106 @@ class BrandColorAnalyzer:
 
         # Generate heatmap if requested
         if generate_heatmap:
-            heatmap_base64 = self._generate_heatmap(bgr_resized, labels, min_dists, h, w, max_d)
-            result["heatmap_base64"] = heatmap_base64
+            heatmap_png = self._generate_heatmap(bgr_resized, labels, min_dists, h, w, max_d)
+            result["heatmap_png"] = heatmap_png
 
         return result
 
-    # ---------- internal helpers ----------
+    def extract_palette(
+        self,
+        bgr_image: np.ndarray,
+        k_clusters: int = DEFAULT_K_CLUSTERS,
+    ) -> list[dict[str, Any]]:
+        """
+        :param bgr_image: OpenCV-style image in BGR, uint8 or convertible
+        :param k_clusters: number of colors to extract (1–20)
+        :return: clusters sorted by coverage, each with hex, lab and coverage (0–1)
+        """
+        if not isinstance(bgr_image, np.ndarray):
+            raise TypeError("bgr_image must be a NumPy array")
 
-    def _build_palette(self, specs: list[BrandColorSpec]) -> list[_BrandColor]:
-        palette: list[_BrandColor] = []
-        for spec in specs:
-            rgb = _hex_to_rgb(spec.hex)
-            lab = _rgb_to_lab_opencv(rgb)
-            chroma = _chroma_from_lab(lab)
-            is_neutral = chroma < NEUTRAL_CHROMA_THRESHOLD
-            palette.append(
-                _BrandColor(
-                    hex="#" + spec.hex.strip().lstrip("#").lower(),
-                    lab=lab,
-                    is_neutral=is_neutral,
-                )
-            )
+        if k_clusters < 1 or k_clusters > 20:
+            raise ValueError("k_clusters must be between 1 and 20")
+
+        # Cluster the downsampled image; cost no longer grows with upload resolution
+        bgr = self._ensure_3_channel_bgr(bgr_image)
+        bgr_resized = _resize_image_keep_aspect(bgr, self.max_image_side)
+        lab_image = self._image_to_lab(bgr_resized)
+
+        h, w = lab_image.shape[:2]
+        k = min(k_clusters, int(h * w))
+        centers, _, coverage = self._kmeans_clusters(lab_image, k)
+
+        palette = [
+            {
+                "hex": self._lab_to_hex(centers[i]),
+                "lab": [float(v) for v in centers[i]],
+                "coverage": float(coverage[i]),
+            }
+            for i in np.argsort(-coverage)
+            if coverage[i] > 0
+        ]
         return palette
 
+    def group_palette(
+        self,
+        palette: list[dict[str, Any]],
+        similarity_threshold: float,
+    ) -> list[dict[str, Any]]:
+        """
+        :param palette: clusters as returned by extract_palette
+        :param similarity_threshold: max Lab distance between colors merged into one group
+        :return: merged clusters sorted by coverage, same shape as the input
+        """
+        if len(palette) < 2:
+            return palette
+
+        labs = np.array([c["lab"] for c in palette], dtype=np.float32)  # (K,3)
+        coverage = np.array([c["coverage"] for c in palette], dtype=np.float64)  # (K,)
+
+        # Full KxK distance matrix in one broadcast instead of a pairwise loop
+        dists = np.linalg.norm(labs[:, np.newaxis, :] - labs[np.newaxis, :, :], axis=2)
+        adjacency = dists < similarity_threshold
+        # Every color is in its own group, even when the threshold is 0
+        np.fill_diagonal(adjacency, True)
+
+        # Connected components: propagate the smallest index through neighbors until stable
+        k = len(palette)
+        groups = np.arange(k)
+        while True:
+            merged = np.where(adjacency, groups[np.newaxis, :], k).min(axis=1)
+            if np.array_equal(merged, groups):
+                break
+            groups = merged
+
+        grouped = []
+        for group in np.unique(groups):
+            members = groups == group
+            group_cov = float(coverage[members].sum())
+            # Coverage-weighted mean keeps the group color close to its largest member
+            group_lab = (labs[members] * coverage[members, np.newaxis]).sum(axis=0) / group_cov
+            grouped.append(
+                {
+                    "hex": self._lab_to_hex(group_lab),
+                    "lab": [float(v) for v in group_lab],
+                    "coverage": group_cov,
+                }
+            )
+
+        grouped.sort(key=lambda c: c["coverage"], reverse=True)
+        return grouped
+
+    # ---------- internal helpers ----------
+
+    def _build_palette(self, specs: list[BrandColorSpec]) -> _BrandPalette:
+        # One cvtColor for the whole palette instead of one per brand color
+        labs = _hexes_to_lab_batch([spec.hex for spec in specs])  # (N,3)
+        return _BrandPalette(
+            hexes=["#" + spec.hex.strip().lstrip("#").lower() for spec in specs],
+            lab=labs,
+            is_neutral=_is_neutral_lab(labs),
+        )
+
     def _ensure_3_channel_bgr(self, img: np.ndarray) -> np.ndarray:
         """Make sure the image is 3-channel BGR (no alpha, not grayscale)."""
         if img.ndim == 2:
@@ -336,8 +415,15 @@ class BrandColorAnalyzer:
             labels:  (H*W,) cluster index per pixel
             coverage: (k,) fraction of pixels in each cluster
         """
-        h, w, _ = lab_image.shape
-        pixels = lab_image.reshape((-1, 3)).astype(np.float32)
+        pixels = lab_image.reshape((-1, 3)).astype(np.float32, copy=False)
+
+        # Fit on a decimated sample of at most KMEANS_MAX_SAMPLE_PIXELS, then label
+        # every pixel against the fitted centers
+        n = pixels.shape[0]
+        sample = pixels
+        if n >= KMEANS_SAMPLE_STRIDE * KMEANS_MIN_SAMPLE_PIXELS:
+            stride = max(KMEANS_SAMPLE_STRIDE, -(-n // KMEANS_MAX_SAMPLE_PIXELS))
+            sample = np.ascontiguousarray(pixels[::stride])
 
         criteria = (
             cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER,
@@ -347,7 +433,7 @@ class BrandColorAnalyzer:
         attempts = 3
 
         _, labels, centers = cv2.kmeans(  # type: ignore[call-overload]
-            data=pixels,
+            data=sample,
             K=k,
             bestLabels=None,
             criteria=criteria,
@@ -355,7 +441,18 @@ class BrandColorAnalyzer:
             flags=cv2.KMEANS_PP_CENTERS,
         )
 
-        labels = labels.flatten()
+        if sample is pixels:
+            labels = labels.flatten()
+        else:
+            # argmin ||p - c||^2 == argmin (||c||^2 - 2 p.c); ||p||^2 is the same for every c
+            center_norms = (centers * centers).sum(axis=1)
+            labels = np.empty(n, dtype=np.intp)
+            for start in range(0, n, KMEANS_LABEL_TILE):
+                tile = pixels[start : start + KMEANS_LABEL_TILE]
+                labels[start : start + KMEANS_LABEL_TILE] = np.argmin(
+                    center_norms - 2.0 * (tile @ centers.T), axis=1
+                )
+
         counts = np.bincount(labels, minlength=k).astype(np.float64)
         total = float(pixels.shape[0])
         coverage = counts / total
@@ -370,7 +467,7 @@ class BrandColorAnalyzer:
         h: int,
         w: int,
         max_d: float,
-    ) -> str:
+    ) -> bytes:
         """
         Generate a heatmap overlay showing brand color alignment per pixel.
 
@@ -387,7 +484,7 @@ class BrandColorAnalyzer:
             max_d: Maximum Lab distance threshold
 
         Returns:
-            Base64-encoded PNG image string
+            PNG-encoded image bytes
         """
         # Map each pixel to its cluster's distance
         pixel_dists = min_dists[labels]  # (H*W,)
@@ -418,10 +515,9 @@ class BrandColorAnalyzer:
         # Blend with original image (50% opacity)
         blended = cv2.addWeighted(bgr_image, 0.5, heatmap_color, 0.5, 0)
 
-        # Encode to PNG and then base64
+        # Encode to PNG; served as-is from the heatmap endpoint
         success, encoded = cv2.imencode(".png", blended)
         if not success:
             raise RuntimeError("Failed to encode heatmap image")
 
-        base64_str = base64.b64encode(encoded.tobytes()).decode("utf-8")
-        return f"data:image/png;base64,{base64_str}"
+        return encoded.tobytes()
@@ -1,6 +1,44 @@
-import re
+from bisect import bisect_right
 from typing import Any
 
+# sRGB channel (0-255) -> linear value; channels only take 256 values, so pow() runs once each
+_SRGB_TO_LINEAR = tuple(
+    c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    for c in (i / 255.0 for i in range(256))
+)
+
+# Contrast ratios only matter relative to these WCAG thresholds
+_WCAG_THRESHOLDS = (3.0, 4.5, 7.0)
+
+
+def _wcag_results(contrast_ratio: float) -> dict[str, dict[str, str]]:
+    """Build the WCAG pass/fail table for a contrast ratio."""
+
+    def status(threshold: float) -> str:
+        return "pass" if contrast_ratio >= threshold else "fail"
+
+    return {
+        "A": {
+            "text": status(3.0),
+            "large_text": status(3.0),
+            "ui_icons": status(3.0),
+        },
+        "AA": {
+            "text": status(4.5),
+            "large_text": status(3.0),
+            "ui_icons": status(3.0),
+        },
+        "AAA": {
+            "text": status(7.0),
+            "large_text": status(4.5),
+            "ui_icons": status(3.0),
+        },
+    }
+
+
+# One shared table per band between thresholds, picked with a single bisect; never mutate
+_WCAG_BY_BAND = tuple(_wcag_results(ratio) for ratio in (0.0, *_WCAG_THRESHOLDS))
+
 
 class ColorValidation:
     """Color validation class for validating color lists."""
@@ -37,6 +75,9 @@ class ColorValidation:
         if validated_colors != normalized_input:
             raise ValueError("Color codes are not compatible - validation failed")
 
+        # Luminance depends on one color only, so compute it once per color, not per pair
+        luminances = [self._calculateLuminance(color) for color in validated_colors]
+
         # Compare each color against each other
         comparisons = {}
         for i in range(len(validated_colors)):
@@ -44,7 +85,9 @@ class ColorValidation:
                 color_a = validated_colors[i]
                 color_b = validated_colors[j]
                 key = f"{color_a}_{color_b}"
-                comparisons[key] = self._wcagValidation(color_a, color_b)
+                comparisons[key] = self._wcagValidation(
+                    color_a, color_b, luminances[i], luminances[j]
+                )
 
         return comparisons
 
@@ -66,25 +109,28 @@ class ColorValidation:
         if len(color) != 7:
             raise ValueError(f"Invalid color format: {color}. Must be 7 characters (#RRGGBB)")
 
-        if not re.match(r"^#[0-9A-Fa-f]{6}$", color):
+        # Exactly three bytes decoded means six hex digits and no stray whitespace
+        try:
+            is_hex = len(bytes.fromhex(color[1:])) == 3
+        except ValueError:
+            is_hex = False
+        if not is_hex:
             raise ValueError(f"Invalid color format: {color}. Must contain valid hex characters")
 
         return color.upper()
 
-    def _wcagValidation(self, color1: str, color2: str) -> dict[str, Any]:
+    def _wcagValidation(self, color1: str, color2: str, lum1: float, lum2: float) -> dict[str, Any]:
         """Private method to validate WCAG contrast between two colors.
 
         Args:
             color1: First color (hex format)
             color2: Second color (hex format)
+            lum1: Relative luminance of color1
+            lum2: Relative luminance of color2
 
         Returns:
             Dict with comprehensive contrast validation results
         """
-        # Calculate luminance for both colors
-        lum1 = self._calculateLuminance(color1)
-        lum2 = self._calculateLuminance(color2)
-
         # Calculate contrast ratio
         contrast_ratio = (max(lum1, lum2) + 0.05) / (min(lum1, lum2) + 0.05)
 
@@ -94,23 +140,7 @@ class ColorValidation:
         return {
             "luminance": {"foreground": round(lum1, 3), "background": round(lum2, 3)},
             "contrast_ratio": f"{contrast_ratio:.1f}:1",
-            "wcag": {
-                "A": {
-                    "text": "pass" if contrast_ratio >= 3.0 else "fail",
-                    "large_text": "pass" if contrast_ratio >= 3.0 else "fail",
-                    "ui_icons": "pass" if contrast_ratio >= 3.0 else "fail",
-                },
-                "AA": {
-                    "text": "pass" if contrast_ratio >= 4.5 else "fail",
-                    "large_text": "pass" if contrast_ratio >= 3.0 else "fail",
-                    "ui_icons": "pass" if contrast_ratio >= 3.0 else "fail",
-                },
-                "AAA": {
-                    "text": "pass" if contrast_ratio >= 7.0 else "fail",
-                    "large_text": "pass" if contrast_ratio >= 4.5 else "fail",
-                    "ui_icons": "pass" if contrast_ratio >= 3.0 else "fail",
-                },
-            },
+            "wcag": _WCAG_BY_BAND[bisect_right(_WCAG_THRESHOLDS, contrast_ratio)],
             "apca": {"score": apca_score, "rating": self._getAPCARating(apca_score)},
             "auto_fixes": self._generateAutoFixes(color1, color2, contrast_ratio),
             "color_blind_risk": self._assessColorBlindRisk(color1, color2),
@@ -125,21 +155,13 @@ class ColorValidation:
         Returns:
             Relative luminance value
         """
-        # Convert hex to RGB
-        r = int(color[1:3], 16) / 255.0
-        g = int(color[3:5], 16) / 255.0
-        b = int(color[5:7], 16) / 255.0
-
-        # Apply gamma correction
-        def gamma_correct(c: float) -> float:
-            return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
-
-        r = gamma_correct(r)
-        g = gamma_correct(g)
-        b = gamma_correct(b)
+        # Convert hex to gamma-corrected RGB via the lookup table
+        r, g, b = bytes.fromhex(color[1:7])
 
         # Calculate luminance
-        return 0.2126 * r + 0.7152 * g + 0.0722 * b
+        return (
+            0.2126 * _SRGB_TO_LINEAR[r] + 0.7152 * _SRGB_TO_LINEAR[g] + 0.0722 * _SRGB_TO_LINEAR[b]
+        )
 
     def _calculateAPCA(self, lum1: float, lum2: float) -> int:
         """Calculate APCA contrast score."""
@@ -3,14 +3,13 @@ Brand validation and color extraction service.
 """
 
 import logging
-import uuid
-from datetime import datetime
+from collections import OrderedDict
+from typing import Any
 
 import cv2
 import numpy as np
-from fastapi import UploadFile
 
-from app.models.common import Color, ImageMetadata
+from app.models.common import Color, ImageMetadata, utcnow
 from app.models.enums import BrandComplianceLevel
 from app.models.requests import (
     BrandCompareImagesRequest,
@@ -27,9 +26,26 @@ from app.models.responses import (
 )
 from app.scripts.BrandColorAlignment import BrandColorAnalyzer, BrandColorSpec
 from app.services.redis_service import RedisService
+from app.utils.concurrency import run_cpu_bound
+from app.utils.file_validation import JPEG_SOI, ImageUpload, read_image_dimensions
+from app.utils.ids import generate_validation_id
 
 logger = logging.getLogger(__name__)
 
+# Heatmaps are kept long enough for the client to fetch them after validating
+HEATMAP_TTL_SECONDS = 3600
+HEATMAP_URL_TEMPLATE = "/api/v1/validate/{validation_id}/heatmap.png"
+
+# Extracted palettes per (digest, max_colors, group_similar, similarity_threshold)
+PALETTE_CACHE_SIZE = 256
+
+# JPEG can be decoded at 1/2, 1/4 or 1/8 scale directly from the DCT coefficients
+_REDUCED_JPEG_DECODE = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
 
 class BrandService:
     """
@@ -50,10 +66,13 @@ class BrandService:
         """
         self._redis = redis_service
         self._color_analyzer = BrandColorAnalyzer()
+        self._palette_cache: OrderedDict[tuple[Any, ...], tuple[list[dict[str, Any]], int]] = (
+            OrderedDict()
+        )
 
     async def validate_image(
         self,
-        image: UploadFile,
+        image: ImageUpload,
         request: BrandValidateImageRequest,
         user_id: str,
     ) -> BrandValidationResponse:
@@ -68,13 +87,15 @@ class BrandService:
         Returns:
             BrandValidationResponse with validation results.
         """
-        validation_id = str(uuid.uuid4())
+        validation_id = generate_validation_id()
 
-        image_metadata = await self._extract_image_metadata(image)
+        # Decode once; metadata and color analysis share the pixels
+        bgr = await run_cpu_bound(self._decode_image, image)
+        image_metadata = self._extract_image_metadata(image, self._image_size(image, bgr))
 
         # Analyze brand colors using BrandColorAnalyzer
-        top_color_matches, alignment_score, heatmap_base64 = await self._analyze_brand_colors(
-            image,
+        top_color_matches, alignment_score, heatmap_png = await self._analyze_brand_colors(
+            bgr,
             request.brand_colors,
             generate_heatmap=request.generate_heatmap,
         )
@@ -91,7 +112,18 @@ class BrandService:
                 compliance_score,
             )
 
-        return BrandValidationResponse(
+        heatmap_url = None
+        if heatmap_png is not None and self._redis:
+            stored = await self._redis.set_bytes(
+                f"heatmap:{validation_id}",
+                heatmap_png,
+                ttl=HEATMAP_TTL_SECONDS,
+            )
+            if stored:
+                heatmap_url = HEATMAP_URL_TEMPLATE.format(validation_id=validation_id)
+
+        # Every field below is produced by this service, so skip re-validation
+        return BrandValidationResponse.model_construct(
             success=True,
             message="Brand validation completed",
             validation_id=validation_id,
@@ -99,14 +131,14 @@ class BrandService:
             compliance_score=compliance_score,
             compliance_level=compliance_level,
             top_color_matches=top_color_matches,
-            heatmap_image=heatmap_base64,
+            heatmap_url=heatmap_url,
             image_metadata=image_metadata,
-            processed_at=datetime.utcnow(),
+            processed_at=utcnow(),
         )
 
     async def extract_colors(
         self,
-        image: UploadFile,
+        image: ImageUpload,
         request: BrandExtractColorsRequest,
         user_id: str,
     ) -> ExtractedColorsResponse:
@@ -129,12 +161,11 @@ class BrandService:
         # - Identify dominant color
         # - Detect palette type (complementary, analogous, etc.)
 
-        validation_id = str(uuid.uuid4())
+        validation_id = generate_validation_id()
 
-        # TODO: Extract actual image metadata
-        image_metadata = await self._extract_image_metadata(image)
+        # Header dimensions only; the image is decoded solely on a palette cache miss
+        image_metadata = self._extract_image_metadata(image, read_image_dimensions(image.content))
 
-        # TODO: Implement actual color extraction
         colors = await self._extract_colors_from_image(
             image,
             request.max_colors,
@@ -170,8 +201,8 @@ class BrandService:
 
     async def compare_images(
         self,
-        image1: UploadFile,
-        image2: UploadFile,
+        image1: ImageUpload,
+        image2: ImageUpload,
         request: BrandCompareImagesRequest,
         user_id: str,
     ) -> ImageComparisonResponse:
@@ -194,11 +225,13 @@ class BrandService:
         # - Compare layouts if requested
         # - Identify and locate differences
 
-        validation_id = str(uuid.uuid4())
+        validation_id = generate_validation_id()
 
         # TODO: Extract metadata for both images
-        image1_metadata = await self._extract_image_metadata(image1)
-        image2_metadata = await self._extract_image_metadata(image2)
+        bgr1 = await run_cpu_bound(self._decode_image, image1)
+        bgr2 = await run_cpu_bound(self._decode_image, image2)
+        image1_metadata = self._extract_image_metadata(image1, self._image_size(image1, bgr1))
+        image2_metadata = self._extract_image_metadata(image2, self._image_size(image2, bgr2))
 
         # TODO: Implement actual comparison
         similarity_score = await self._calculate_similarity(
@@ -232,54 +265,88 @@ class BrandService:
             image2_metadata=image2_metadata,
         )
 
-    async def _extract_image_metadata(self, image: UploadFile) -> ImageMetadata:
+    def _extract_image_metadata(
+        self,
+        image: ImageUpload,
+        size: tuple[int, int] | None,
+    ) -> ImageMetadata:
         """
         Extract metadata from uploaded image.
 
         Args:
             image: The uploaded image file.
+            size: Image (width, height), or None if unknown.
 
         Returns:
             ImageMetadata object.
         """
-        content = await image.read()
-        await image.seek(0)  # Reset for further processing
-
-        # Decode image to get dimensions
-        nparr = np.frombuffer(content, np.uint8)
-        img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-
         width = None
         height = None
-        if img is not None:
-            height, width = img.shape[:2]
+        if size is not None:
+            width, height = size
 
         return ImageMetadata(
             filename=image.filename or "unknown",
-            size_bytes=len(content),
+            size_bytes=len(image.content),
             width=width,
             height=height,
             format=image.filename.split(".")[-1] if image.filename else "unknown",
             mime_type=image.content_type or "application/octet-stream",
         )
 
-    async def _read_image_as_bgr(self, image: UploadFile) -> np.ndarray:
+    def _decode_image(self, image: ImageUpload) -> np.ndarray | None:
+        """
+        Decode an uploaded image with OpenCV.
+
+        Large JPEGs are decoded at a reduced scale that still covers the analyzer's
+        working size, so the full-resolution pixels are never materialized.
+
+        Args:
+            image: The uploaded image file.
+
+        Returns:
+            Contiguous uint8 BGR array, or None if the bytes are not a decodable image.
+        """
+        flags = cv2.IMREAD_COLOR
+        if image.content[:2] == JPEG_SOI:
+            size = read_image_dimensions(image.content)
+            if size is not None:
+                longest = max(size)
+                for factor, reduced_flag in _REDUCED_JPEG_DECODE:
+                    if longest // factor >= self._color_analyzer.max_image_side:
+                        flags = reduced_flag
+                        break
+
+        return cv2.imdecode(np.frombuffer(image.content, np.uint8), flags)
+
+    def _image_size(
+        self,
+        image: ImageUpload,
+        bgr: np.ndarray | None,
+    ) -> tuple[int, int] | None:
         """
-        Read an uploaded image file as BGR numpy array.
+        Get the original (width, height) of an image that may have been decoded reduced.
 
         Args:
             image: The uploaded image file.
+            bgr: Decoded image pixels (None if decoding failed).
 
         Returns:
-            BGR numpy array.
+            Tuple of (width, height), or None if the size is unknown.
         """
-        content = await image.read()
-        await image.seek(0)
-        nparr = np.frombuffer(content, np.uint8)
-        bgr = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
         if bgr is None:
-            raise ValueError("Failed to decode image")
-        return bgr
+            return None
+
+        decoded_height, decoded_width = bgr.shape[:2]
+        size = read_image_dimensions(image.content)
+        if size is None:
+            return decoded_width, decoded_height
+
+        width, height = size
+        # The decoder applies EXIF rotation; keep the header size in the same orientation
+        if (decoded_width > decoded_height) != (width > height):
+            width, height = height, width
+        return width, height
 
     def _hex_to_color_name(self, hex_color: str) -> str:
         """
@@ -335,32 +402,33 @@ class BrandService:
 
     async def _analyze_brand_colors(
         self,
-        image: UploadFile,
+        bgr: np.ndarray | None,
         brand_colors: list[str],
         generate_heatmap: bool = False,
-    ) -> tuple[list[DetectedColorMatch], float, str | None]:
+    ) -> tuple[list[DetectedColorMatch], float, bytes | None]:
         """
         Analyze image colors against brand colors using BrandColorAnalyzer.
 
         Args:
-            image: The uploaded image.
+            bgr: Decoded image pixels (None if decoding failed).
             brand_colors: List of brand colors in hex.
             generate_heatmap: Whether to generate a heatmap overlay.
 
         Returns:
-            Tuple of (list of DetectedColorMatch objects, alignment_score, heatmap_base64 or None).
+            Tuple of (list of DetectedColorMatch objects, alignment_score, heatmap PNG bytes or None).
         """
         if not brand_colors:
             return [], 0.0, None
 
-        # Read image as BGR
-        bgr = await self._read_image_as_bgr(image)
+        if bgr is None:
+            raise ValueError("Failed to decode image")
 
         # Convert brand colors to BrandColorSpec
         brand_specs = [BrandColorSpec(hex=color) for color in brand_colors]
 
-        # Analyze using BrandColorAnalyzer
-        result = self._color_analyzer.analyze(
+        # Analyze using BrandColorAnalyzer (CPU-bound, off the event loop)
+        result = await run_cpu_bound(
+            self._color_analyzer.analyze,
             bgr_image=bgr,
             brand_colors=brand_specs,
             k_clusters=8,
@@ -369,7 +437,7 @@ class BrandService:
 
         alignment_score = result["alignment_score"]
         top_detected = result.get("top_detected_colors", [])
-        heatmap_base64 = result.get("heatmap_base64")
+        heatmap_png = result.get("heatmap_png")
 
         # Convert to DetectedColorMatch objects
         matches = []
@@ -397,7 +465,7 @@ class BrandService:
                 )
 
             matches.append(
-                DetectedColorMatch(
+                DetectedColorMatch.model_construct(
                     detected_color=detected_hex,
                     detected_color_name=detected_name,
                     nearest_brand_color=brand_hex,
@@ -407,7 +475,7 @@ class BrandService:
                 )
             )
 
-        return matches, alignment_score, heatmap_base64
+        return matches, alignment_score, heatmap_png
 
     def _determine_compliance_level(self, score: float) -> BrandComplianceLevel:
         """
@@ -429,7 +497,7 @@ class BrandService:
 
     async def _extract_colors_from_image(
         self,
-        image: UploadFile,
+        image: ImageUpload,
         max_colors: int,
         group_similar: bool,
         similarity_threshold: float,
@@ -446,12 +514,95 @@ class BrandService:
         Returns:
             List of ExtractedColor objects.
         """
-        # TODO: Implement color extraction
-        # - Use k-means clustering or similar
-        # - Group similar colors if requested
-        # - Calculate percentages
+        palette, total_pixels = await self._get_palette(
+            image, max_colors, group_similar, similarity_threshold
+        )
 
-        return []
+        colors = []
+        for index, cluster in enumerate(palette):
+            hex_color = cluster["hex"].upper()
+            rgb_int = int(hex_color[1:], 16)
+            colors.append(
+                ExtractedColor(
+                    color=Color(
+                        hex=hex_color,
+                        rgb={"r": rgb_int >> 16, "g": (rgb_int >> 8) & 0xFF, "b": rgb_int & 0xFF},
+                        name=self._hex_to_color_name(hex_color),
+                    ),
+                    percentage=round(cluster["coverage"] * 100.0, 2),
+                    pixel_count=int(round(cluster["coverage"] * total_pixels)),
+                    is_dominant=index == 0,
+                )
+            )
+
+        return colors
+
+    async def _get_palette(
+        self,
+        image: ImageUpload,
+        max_colors: int,
+        group_similar: bool,
+        similarity_threshold: float,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Get the palette of an image, reusing it when the same bytes were seen before.
+
+        The image is only decoded on a cache miss.
+
+        Args:
+            image: The uploaded image.
+            max_colors: Maximum colors to extract.
+            group_similar: Whether to group similar colors.
+            similarity_threshold: Threshold for grouping.
+
+        Returns:
+            Tuple of (palette clusters, total pixel count of the original image).
+        """
+        key = (image.digest, max_colors, group_similar, similarity_threshold)
+        cached = self._palette_cache.get(key)
+        if cached is not None:
+            self._palette_cache.move_to_end(key)
+            return cached
+
+        bgr = await run_cpu_bound(self._decode_image, image)
+        size = self._image_size(image, bgr)
+        if bgr is None or size is None:
+            raise ValueError("Failed to decode image")
+        total_pixels = size[0] * size[1]
+
+        palette = await run_cpu_bound(
+            self._build_palette, bgr, max_colors, group_similar, similarity_threshold
+        )
+
+        self._palette_cache[key] = (palette, total_pixels)
+        if len(self._palette_cache) > PALETTE_CACHE_SIZE:
+            self._palette_cache.popitem(last=False)
+
+        return palette, total_pixels
+
+    def _build_palette(
+        self,
+        bgr: np.ndarray,
+        max_colors: int,
+        group_similar: bool,
+        similarity_threshold: float,
+    ) -> list[dict[str, Any]]:
+        """
+        Cluster an image into a palette, optionally merging similar colors.
+
+        Args:
+            bgr: Decoded image pixels.
+            max_colors: Maximum colors to extract.
+            group_similar: Whether to group similar colors.
+            similarity_threshold: Threshold for grouping.
+
+        Returns:
+            Palette clusters sorted by coverage.
+        """
+        palette = self._color_analyzer.extract_palette(bgr, k_clusters=max_colors)
+        if group_similar:
+            palette = self._color_analyzer.group_palette(palette, similarity_threshold)
+        return palette
 
     async def _detect_palette_type(
         self,
@@ -473,8 +624,8 @@ class BrandService:
 
     async def _calculate_similarity(
         self,
-        image1: UploadFile,
-        image2: UploadFile,
+        image1: ImageUpload,
+        image2: ImageUpload,
         sensitivity: float,
     ) -> float:
         """
@@ -496,8 +647,8 @@ class BrandService:
 
     async def _compare_color_palettes(
         self,
-        image1: UploadFile,
-        image2: UploadFile,
+        image1: ImageUpload,
+        image2: ImageUpload,
     ) -> float:
         """
         Compare color palettes of two images.
@@ -514,8 +665,8 @@ class BrandService:
 
     async def _compare_layouts(
         self,
-        image1: UploadFile,
-        image2: UploadFile,
+        image1: ImageUpload,
+        image2: ImageUpload,
     ) -> float:
         """
         Compare layouts of two images.
@@ -532,8 +683,8 @@ class BrandService:
 
     async def _find_differences(
         self,
-        image1: UploadFile,
-        image2: UploadFile,
+        image1: ImageUpload,
+        image2: ImageUpload,
         request: BrandCompareImagesRequest,
     ) -> list[ImageDifference]:
         """
@@ -569,7 +720,7 @@ class BrandService:
                     "user_id": user_id,
                     "type": validation_type,
                     "score": score,
-                    "created_at": datetime.utcnow().isoformat(),
+                    "created_at": utcnow().isoformat(),
                 },
             )
 
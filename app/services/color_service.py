@@ -3,6 +3,7 @@ Color analysis and contrast calculation service.
 """
 
 import logging
+from functools import lru_cache
 
 from app.models.enums import ColorFormat, ContrastRating, TextSize, WCAGLevel
 from app.models.responses import ColorCompareResponse, ColorRecommendation
@@ -26,9 +27,14 @@ class ColorService:
     WCAG_AAA_NORMAL_TEXT = 7.0
     WCAG_AAA_LARGE_TEXT = 4.5
 
+    # Brand palettes repeat the same (fg, bg) pairs across requests
+    CONTRAST_CACHE_SIZE = 4096
+
     def __init__(self) -> None:
         """Initialize color service."""
-        pass
+        self._cached_contrast_ratio = lru_cache(maxsize=self.CONTRAST_CACHE_SIZE)(
+            self._compute_contrast_ratio
+        )
 
     def calculate_contrast_ratio(
         self,
@@ -45,6 +51,19 @@ class ColorService:
             foreground: Foreground color in hex format.
             background: Background color in hex format.
 
+        Returns:
+            Contrast ratio as a float (1 to 21).
+        """
+        return self._cached_contrast_ratio(foreground.upper(), background.upper())
+
+    def _compute_contrast_ratio(self, foreground: str, background: str) -> float:
+        """
+        Compute the contrast ratio between two normalized hex colors.
+
+        Args:
+            foreground: Foreground color in uppercase hex format.
+            background: Background color in uppercase hex format.
+
         Returns:
             Contrast ratio as a float (1 to 21).
         """
@@ -2,12 +2,14 @@
 Redis service for caching and data storage.
 """
 
+import asyncio
 import json
 import logging
 from typing import Any, TypeVar
 
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.client import NEVER_DECODE
 
 from app.config import Settings, get_settings
 
@@ -48,21 +50,49 @@ class RedisService:
         # - Set up connection retry logic
         # - Test connection with ping
         try:
-            self._client = redis.from_url(
+            # A blocking pool waits (bounded) for a free connection instead of
+            # opening connections without limit under load
+            pool = redis.BlockingConnectionPool.from_url(
                 self._settings.redis_url,
+                max_connections=self._settings.redis_max_connections,
+                timeout=self._settings.redis_pool_timeout_seconds,
                 encoding="utf-8",
                 decode_responses=True,
             )
+            self._client = Redis(connection_pool=pool)
             await self._client.ping()
+            await self._warm_pool()
             logger.info("Connected to Redis successfully")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             raise ConnectionError(f"Redis connection failed: {e}") from e
 
+    async def _warm_pool(self) -> None:
+        """
+        Open the configured minimum number of pool connections up front.
+
+        Connections are checked out together so each one is a new socket,
+        then returned; the first requests after startup skip the
+        connect/auth handshake.
+        """
+        if not self._client:
+            return
+
+        pool = self._client.connection_pool
+        warm = min(
+            self._settings.redis_pool_min_connections,
+            self._settings.redis_max_connections,
+        )
+        connections = await asyncio.gather(*(pool.get_connection("PING") for _ in range(warm)))
+        for connection in connections:
+            await pool.release(connection)
+
     async def disconnect(self) -> None:
         """Close Redis connection."""
         if self._client:
             await self._client.close()
+            # The client does not own a pool it was handed, so release it explicitly
+            await self._client.connection_pool.disconnect()
             self._client = None
             logger.info("Disconnected from Redis")
 
@@ -131,6 +161,60 @@ class RedisService:
             logger.error(f"Redis set error for key {key}: {e}")
             return False
 
+    async def get_bytes(self, key: str) -> bytes | None:
+        """
+        Get a raw binary value from Redis.
+
+        The client decodes responses to str by default; this bypasses that
+        for a single GET so binary payloads (e.g. PNGs) round-trip intact.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The stored bytes or None if not found.
+        """
+        if not self._client:
+            raise ConnectionError("Redis client not connected")
+
+        full_key = f"{self._prefix}{key}"
+        try:
+            value = await self._client.execute_command("GET", full_key, **{NEVER_DECODE: []})
+            return bytes(value) if value is not None else None
+        except Exception as e:
+            logger.error(f"Redis get_bytes error for key {key}: {e}")
+            return None
+
+    async def set_bytes(
+        self,
+        key: str,
+        value: bytes,
+        ttl: int | None = None,
+    ) -> bool:
+        """
+        Store a raw binary value in Redis with optional TTL.
+
+        Args:
+            key: The cache key.
+            value: The bytes to store, written as-is.
+            ttl: Time-to-live in seconds. Uses default if not provided.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        if not self._client:
+            raise ConnectionError("Redis client not connected")
+
+        full_key = f"{self._prefix}{key}"
+        ttl = ttl or self._settings.redis_cache_ttl
+
+        try:
+            result = await self._client.setex(full_key, ttl, value)
+            return bool(result)
+        except Exception as e:
+            logger.error(f"Redis set_bytes error for key {key}: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """
         Delete a key from Redis.
@@ -5,12 +5,13 @@ Storage service for file and image management.
 import hashlib
 import logging
 import uuid
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
 from fastapi import UploadFile
 
 from app.config import Settings, get_settings
+from app.models.common import utcnow
 from app.services.redis_service import RedisService
 
 logger = logging.getLogger(__name__)
@@ -76,7 +77,7 @@ class StorageService:
             "content_type": file.content_type,
             "size_bytes": len(content),
             "hash": file_hash,
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": utcnow().isoformat(),
         }
 
         # TODO: Implement actual storage based on file size
@@ -205,7 +206,7 @@ class StorageService:
         return {
             "storage_id": storage_id,
             "upload_url": f"https://upload.example.com/{storage_id}",
-            "expires_at": (datetime.utcnow() + timedelta(seconds=expiry_seconds)).isoformat(),
+            "expires_at": (utcnow() + timedelta(seconds=expiry_seconds)).isoformat(),
         }
 
     async def cleanup_expired_files(self) -> int:
@@ -3,10 +3,12 @@ Combined validation service for managing validation history and reruns.
 """
 
 import logging
-import uuid
 from datetime import datetime
 from typing import Any
 
+from pydantic import TypeAdapter
+
+from app.models.common import utcnow
 from app.models.enums import ValidationStatus, ValidationType
 from app.models.requests import ValidationHistoryParams, ValidationRerunRequest
 from app.models.responses import (
@@ -14,11 +16,18 @@ from app.models.responses import (
     ValidationHistoryItem,
     ValidationHistoryResponse,
     ValidationRerunResponse,
+    WCAGIssue,
+    WCAGIssuesPage,
 )
 from app.services.redis_service import RedisService
+from app.utils.ids import generate_validation_id
 
 logger = logging.getLogger(__name__)
 
+# Built once at import and reused for every history page
+_HISTORY_ITEMS_ADAPTER = TypeAdapter(list[ValidationHistoryItem])
+_ISSUES_ADAPTER = TypeAdapter(list[WCAGIssue])
+
 
 class ValidationService:
     """
@@ -111,11 +120,9 @@ class ValidationService:
             success=True,
             message="Validation details retrieved",
             validation_id=validation_id,
-            validation_type=ValidationType(validation.get("type", "combined")),
-            status=ValidationStatus(validation.get("status", "completed")),
-            created_at=datetime.fromisoformat(
-                validation.get("created_at", datetime.utcnow().isoformat())
-            ),
+            validation_type=validation.get("type", ValidationType.COMBINED),
+            status=validation.get("status", ValidationStatus.COMPLETED),
+            created_at=datetime.fromisoformat(validation.get("created_at", utcnow().isoformat())),
             completed_at=(
                 datetime.fromisoformat(validation["completed_at"])
                 if validation.get("completed_at")
@@ -127,6 +134,89 @@ class ValidationService:
             image_metadata=None,  # TODO: Include if available
         )
 
+    async def get_heatmap(
+        self,
+        validation_id: str,
+        user_id: str,
+    ) -> bytes:
+        """
+        Get the heatmap PNG stored for a brand validation.
+
+        Args:
+            validation_id: The validation ID.
+            user_id: The requesting user's ID.
+
+        Returns:
+            The PNG image bytes.
+
+        Raises:
+            ValueError: If validation or heatmap not found, or access denied.
+        """
+        validation = await self._fetch_validation(validation_id)
+
+        if not validation:
+            raise ValueError(f"Validation {validation_id} not found")
+
+        # Verify ownership
+        if validation.get("user_id") != user_id:
+            raise ValueError("Access denied to this validation")
+
+        heatmap = await self._redis.get_bytes(f"heatmap:{validation_id}") if self._redis else None
+        if heatmap is None:
+            raise ValueError(f"No heatmap available for validation {validation_id}")
+
+        return heatmap
+
+    async def get_issues(
+        self,
+        validation_id: str,
+        user_id: str,
+        page: int = 1,
+        page_size: int = 100,
+    ) -> WCAGIssuesPage:
+        """
+        Get a page of the WCAG issues stored for an image validation.
+
+        Args:
+            validation_id: The validation ID.
+            user_id: The requesting user's ID.
+            page: Page number.
+            page_size: Issues per page.
+
+        Returns:
+            WCAGIssuesPage with the requested slice of issues.
+
+        Raises:
+            ValueError: If validation or issues not found, or access denied.
+        """
+        validation = await self._fetch_validation(validation_id)
+
+        if not validation:
+            raise ValueError(f"Validation {validation_id} not found")
+
+        # Verify ownership
+        if validation.get("user_id") != user_id:
+            raise ValueError("Access denied to this validation")
+
+        raw_issues = await self._redis.get(f"wcag_issues:{validation_id}") if self._redis else None
+        if raw_issues is None:
+            raise ValueError(f"No stored issues for validation {validation_id}")
+
+        start = (page - 1) * page_size
+        items = _ISSUES_ADAPTER.validate_python(raw_issues[start : start + page_size])
+        total = len(raw_issues)
+
+        return WCAGIssuesPage(
+            success=True,
+            message="WCAG issues retrieved",
+            validation_id=validation_id,
+            items=items,
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=(total + page_size - 1) // page_size,
+        )
+
     async def rerun_validation(
         self,
         validation_id: str,
@@ -162,7 +252,7 @@ class ValidationService:
             raise ValueError("Access denied to this validation")
 
         # Create new validation
-        new_validation_id = str(uuid.uuid4())
+        new_validation_id = generate_validation_id()
 
         # Merge parameters
         new_params = original.get("request_params", {}).copy()
@@ -223,8 +313,8 @@ class ValidationService:
             "request_params": request_params,
             "result": result,
             "error": error,
-            "created_at": datetime.utcnow().isoformat(),
-            "completed_at": datetime.utcnow().isoformat(),
+            "created_at": utcnow().isoformat(),
+            "completed_at": utcnow().isoformat(),
         }
 
         if self._redis:
@@ -255,7 +345,7 @@ class ValidationService:
         # - Apply pagination
         # - Fetch validation summaries
 
-        items = []
+        rows: list[dict[str, Any]] = []
 
         if self._redis:
             # Get user's validation IDs
@@ -267,9 +357,11 @@ class ValidationService:
             end = start + params.page_size
             page_ids = validation_ids[start:end]
 
-            # Fetch each validation
+            # Fetch the whole page in one MGET round-trip instead of one GET per item
+            validations = await self._redis.get_many([f"validation:{vid}" for vid in page_ids])
+
             for vid in page_ids:
-                validation = await self._fetch_validation(vid)
+                validation = validations.get(f"validation:{vid}")
                 if validation:
                     # Apply filters
                     if params.validation_type and validation.get("type") != params.validation_type:
@@ -277,25 +369,23 @@ class ValidationService:
                     if params.status and validation.get("status") != params.status:
                         continue
 
-                    items.append(
-                        ValidationHistoryItem(
-                            validation_id=vid,
-                            validation_type=ValidationType(validation.get("type", "combined")),
-                            status=ValidationStatus(validation.get("status", "completed")),
-                            created_at=datetime.fromisoformat(
-                                validation.get("created_at", datetime.utcnow().isoformat())
-                            ),
-                            completed_at=(
-                                datetime.fromisoformat(validation["completed_at"])
-                                if validation.get("completed_at")
-                                else None
+                    # Raw values; ISO timestamps and enum strings are parsed by the adapter
+                    rows.append(
+                        {
+                            "validation_id": vid,
+                            "validation_type": validation.get("type", ValidationType.COMBINED),
+                            "status": validation.get("status", ValidationStatus.COMPLETED),
+                            "created_at": validation.get("created_at") or utcnow(),
+                            "completed_at": validation.get("completed_at") or None,
+                            "summary": self._generate_summary(validation),
+                            "compliance_score": (validation.get("result") or {}).get(
+                                "compliance_score"
                             ),
-                            summary=self._generate_summary(validation),
-                            compliance_score=validation.get("result", {}).get("compliance_score"),
-                        )
+                        }
                     )
 
-        return items
+        # One validation pass over the whole page instead of a model per row
+        return _HISTORY_ITEMS_ADAPTER.validate_python(rows)
 
     async def _count_history_items(
         self,
@@ -356,7 +446,7 @@ class ValidationService:
             "type": validation_type,
             "status": ValidationStatus.PENDING.value,
             "request_params": request_params,
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": utcnow().isoformat(),
         }
 
         if self._redis:
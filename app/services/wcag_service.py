@@ -3,12 +3,10 @@ WCAG accessibility validation service.
 """
 
 import logging
-import uuid
-from datetime import datetime
 
-from fastapi import UploadFile
+from pydantic import TypeAdapter
 
-from app.models.common import BoundingBox, ImageMetadata
+from app.models.common import BoundingBox, ImageMetadata, utcnow
 from app.models.enums import TextSize, WCAGLevel, WCAGVersion
 from app.models.requests import WCAGValidateImageRequest, WCAGValidateTextContrastRequest
 from app.models.responses import (
@@ -21,9 +19,16 @@ from app.models.responses import (
 from app.scripts.ImageA11yEvalution import evaluate_image_accessibility_from_bytes
 from app.services.color_service import ColorService
 from app.services.redis_service import RedisService
+from app.utils.concurrency import run_cpu_bound
+from app.utils.file_validation import ImageUpload
+from app.utils.ids import generate_validation_id
 
 logger = logging.getLogger(__name__)
 
+# Full issue lists beyond the first page are kept for GET /validate/{id}/issues
+ISSUES_TTL_SECONDS = 3600
+_ISSUES_ADAPTER = TypeAdapter(list[WCAGIssue])
+
 
 class WCAGService:
     """
@@ -71,7 +76,7 @@ class WCAGService:
 
     async def validate_image(
         self,
-        image: UploadFile,
+        image: ImageUpload,
         request: WCAGValidateImageRequest,
         user_id: str,
     ) -> WCAGValidationResponse:
@@ -86,10 +91,10 @@ class WCAGService:
         Returns:
             WCAGValidationResponse with validation results.
         """
-        validation_id = str(uuid.uuid4())
+        validation_id = generate_validation_id()
 
         # Extract image metadata
-        image_metadata = await self._extract_image_metadata(image)
+        image_metadata = self._extract_image_metadata(image)
 
         # Detect issues using the accessibility evaluation script
         issues, eval_result = await self._detect_wcag_issues(image, request)
@@ -126,6 +131,10 @@ class WCAGService:
             # For A target: compliant if no A-level issues
             is_compliant = len(a_level_issues) == 0
 
+        # Only a bounded slice of the issues goes into the response
+        page_issues = issues[: request.issues_limit]
+        issues_truncated = len(page_issues) < len(issues)
+
         # Cache result
         if self._redis:
             await self._cache_validation_result(
@@ -134,19 +143,28 @@ class WCAGService:
                 "wcag_image",
                 compliance_score,
             )
+            # Stored even when nothing was cut, so the issues endpoint serves every validation
+            await self._redis.set(
+                f"wcag_issues:{validation_id}",
+                _ISSUES_ADAPTER.dump_json(issues).decode(),
+                ttl=ISSUES_TTL_SECONDS,
+            )
 
-        return WCAGValidationResponse(
+        # Every field below is produced by this service, so skip re-validation
+        return WCAGValidationResponse.model_construct(
             success=True,
             message="WCAG validation completed",
             validation_id=validation_id,
             is_compliant=is_compliant,
             compliance_score=compliance_score,
             wcag_level_achieved=wcag_level_achieved,
-            issues=issues,
+            issues=page_issues,
+            issues_total=len(issues),
+            issues_truncated=issues_truncated,
             passed_criteria=passed_criteria,
             suggestions=suggestions,
             image_metadata=image_metadata,
-            processed_at=datetime.utcnow(),
+            processed_at=utcnow(),
         )
 
     async def validate_text_contrast(
@@ -170,7 +188,7 @@ class WCAGService:
         # - Check against AA and AAA requirements
         # - Generate recommendations if non-compliant
 
-        validation_id = str(uuid.uuid4())
+        validation_id = generate_validation_id()
 
         # Calculate contrast ratio
         contrast_ratio = self._color_service.calculate_contrast_ratio(
@@ -219,7 +237,8 @@ class WCAGService:
                 100.0 if is_compliant else 0.0,
             )
 
-        return WCAGTextContrastResponse(
+        # Every field below is produced by this service, so skip re-validation
+        return WCAGTextContrastResponse.model_construct(
             success=True,
             message="Text contrast validation completed",
             validation_id=validation_id,
@@ -270,15 +289,12 @@ class WCAGService:
             total_level_aaa=level_aaa_count,
         )
 
-    async def _extract_image_metadata(self, image: UploadFile) -> ImageMetadata:
+    def _extract_image_metadata(self, image: ImageUpload) -> ImageMetadata:
         """Extract metadata from uploaded image."""
         # TODO: Implement metadata extraction
-        content = await image.read()
-        await image.seek(0)
-
         return ImageMetadata(
             filename=image.filename or "unknown",
-            size_bytes=len(content),
+            size_bytes=len(image.content),
             width=None,
             height=None,
             format=image.filename.split(".")[-1] if image.filename else "unknown",
@@ -287,7 +303,7 @@ class WCAGService:
 
     async def _detect_wcag_issues(
         self,
-        image: UploadFile,
+        image: ImageUpload,
         request: WCAGValidateImageRequest,
     ) -> tuple[list[WCAGIssue], dict]:
         """
@@ -302,12 +318,8 @@ class WCAGService:
         """
         issues: list[WCAGIssue] = []
 
-        # Read image bytes
-        content = await image.read()
-        await image.seek(0)
-
-        # Run accessibility evaluation
-        eval_result = evaluate_image_accessibility_from_bytes(content)
+        # Run accessibility evaluation (decode + OCR, off the event loop)
+        eval_result = await run_cpu_bound(evaluate_image_accessibility_from_bytes, image.content)
 
         # Convert regions with issues to WCAGIssue objects
         if request.check_color_contrast:
@@ -558,7 +570,7 @@ class WCAGService:
                     WCAGCriterion(
                         id=criterion_id,
                         title=data["title"],
-                        level=WCAGLevel(data["level"]),
+                        level=data["level"],
                         description=data["description"],
                         how_to_meet="See WCAG documentation",  # TODO: Add actual guidance
                         techniques=[],  # TODO: Add sufficient techniques
@@ -582,7 +594,7 @@ class WCAGService:
                     "user_id": user_id,
                     "type": validation_type,
                     "score": score,
-                    "created_at": datetime.utcnow().isoformat(),
+                    "created_at": utcnow().isoformat(),
                 },
             )
 
@@ -5,6 +5,11 @@ Utility functions and helpers.
 from app.utils.cache import cache, cached, invalidate_cache
 from app.utils.file_validation import (
     FileValidationError,
+    ImageUpload,
+    read_image_dimensions,
+    read_image_upload,
+    sniff_image_type,
+    validate_file_content,
     validate_file_extension,
     validate_file_size,
     validate_image_file,
@@ -18,6 +23,11 @@ __all__ = [
     "invalidate_cache",
     # File validation
     "FileValidationError",
+    "ImageUpload",
+    "read_image_dimensions",
+    "read_image_upload",
+    "sniff_image_type",
+    "validate_file_content",
     "validate_file_extension",
     "validate_file_size",
     "validate_image_file",
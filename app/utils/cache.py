@@ -184,7 +184,7 @@ def cached(
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Build cache key
             if key_builder:
-                cache_key = key_builder(*args, **kwargs)
+                cache_key = f"{key_prefix}:{key_builder(*args, **kwargs)}"
             else:
                 # Default key builder using args hash
                 key_data = {
@@ -209,7 +209,10 @@ def cached(
             result = await func(*args, **kwargs)
 
             if result is not None:
-                await cache_manager.set(cache_key, result, ttl)
+                # Pydantic models (e.g. endpoint responses) are serialized in one
+                # pass by pydantic-core; RedisService stores strings as-is
+                value = result.model_dump_json() if hasattr(result, "model_dump_json") else result
+                await cache_manager.set(cache_key, value, ttl)
 
             return result
 
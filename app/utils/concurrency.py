@@ -0,0 +1,49 @@
+"""
+Helpers for running CPU-bound work off the event loop.
+"""
+
+import functools
+from collections.abc import Callable
+from typing import ParamSpec, TypeVar
+
+import anyio.to_thread
+from anyio import CapacityLimiter
+
+from app.config import get_settings
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Created on first use; anyio limiters must be built inside a running event loop
+_cpu_limiter: CapacityLimiter | None = None
+
+
+def _get_cpu_limiter() -> CapacityLimiter:
+    """Get the limiter that bounds concurrent CPU-bound jobs."""
+    global _cpu_limiter
+    if _cpu_limiter is None:
+        _cpu_limiter = CapacityLimiter(get_settings().cpu_worker_threads)
+    return _cpu_limiter
+
+
+async def run_cpu_bound(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Run a CPU-bound function in a worker thread so the event loop stays responsive.
+
+    OpenCV and NumPy release the GIL inside their kernels, so image work
+    runs in parallel across threads without pickling uploads into another
+    process. A dedicated limiter keeps image jobs from exhausting the
+    default threadpool used for sync endpoints and dependencies.
+
+    Args:
+        func: The function to run.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        The function's return value.
+    """
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args, **kwargs),
+        limiter=_get_cpu_limiter(),
+    )
@@ -2,7 +2,11 @@
 File validation utilities for upload handling.
 """
 
+import hashlib
 import logging
+import struct
+from collections.abc import Sequence
+from dataclasses import dataclass
 
 from fastapi import HTTPException, UploadFile, status
 
@@ -10,6 +14,30 @@ from app.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
+# Uploads are pulled off the spooled file in fixed-size chunks
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SOI = b"\xff\xd8"
+
+# Enough leading bytes to recognize every allowed format
+SNIFF_SIZE = 64
+
+# JPEG start-of-frame markers (baseline, progressive, lossless, ...) that carry the size
+_JPEG_SOF_MARKERS = frozenset(
+    {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ImageUpload:
+    """A validated upload read into memory once, with a content digest."""
+
+    content: bytes
+    filename: str | None
+    content_type: str | None
+    digest: str
+
 
 class FileValidationError(Exception):
     """Raised when file validation fails."""
@@ -22,7 +50,7 @@ class FileValidationError(Exception):
 
 def validate_file_extension(
     filename: str | None,
-    allowed_extensions: list[str] | None = None,
+    allowed_extensions: Sequence[str] | None = None,
     settings: Settings | None = None,
 ) -> str:
     """
@@ -49,6 +77,11 @@ def validate_file_extension(
 
     settings = settings or get_settings()
     allowed = allowed_extensions or settings.allowed_image_extensions
+    allowed_set = (
+        frozenset(ext.lower() for ext in allowed_extensions)
+        if allowed_extensions
+        else settings.allowed_extensions_set
+    )
 
     # Extract extension
     if "." not in filename:
@@ -59,7 +92,7 @@ def validate_file_extension(
 
     extension = filename.rsplit(".", 1)[-1].lower()
 
-    if extension not in [ext.lower() for ext in allowed]:
+    if extension not in allowed_set:
         raise FileValidationError(
             f"File extension '{extension}' is not allowed. "
             f"Allowed extensions: {', '.join(allowed)}",
@@ -95,10 +128,12 @@ def validate_file_size(
     settings = settings or get_settings()
     max_size = max_size_bytes or settings.max_file_size_bytes
 
-    # Get file size
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
+    # The multipart parser records the size while spooling; seek only if it did not
+    file_size = file.size
+    if file_size is None:
+        file.file.seek(0, 2)  # Seek to end
+        file_size = file.file.tell()
+        file.file.seek(0)  # Reset to beginning
 
     if file_size > max_size:
         max_mb = max_size / (1024 * 1024)
@@ -113,7 +148,7 @@ def validate_file_size(
 
 def validate_mime_type(
     content_type: str | None,
-    allowed_types: list[str] | None = None,
+    allowed_types: Sequence[str] | None = None,
     settings: Settings | None = None,
 ) -> str:
     """
@@ -142,11 +177,16 @@ def validate_mime_type(
 
     settings = settings or get_settings()
     allowed = allowed_types or settings.allowed_mime_types
+    allowed_set = (
+        frozenset(t.lower() for t in allowed_types)
+        if allowed_types
+        else settings.allowed_mime_types_set
+    )
 
     # Normalize content type (remove parameters like charset)
     mime_type = content_type.split(";")[0].strip().lower()
 
-    if mime_type not in [t.lower() for t in allowed]:
+    if mime_type not in allowed_set:
         raise FileValidationError(
             f"MIME type '{mime_type}' is not allowed. " f"Allowed types: {', '.join(allowed)}",
             "INVALID_MIME_TYPE",
@@ -155,6 +195,53 @@ def validate_mime_type(
     return mime_type
 
 
+def sniff_image_type(header: bytes) -> str | None:
+    """
+    Identify an image format from its leading bytes.
+
+    Args:
+        header: The first bytes of the file (SNIFF_SIZE is enough).
+
+    Returns:
+        The MIME type the content really has, or None if it is not a known image.
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header.startswith(PNG_SIGNATURE):
+        return "image/png"
+    if header.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    # SVG is text; accept an XML declaration or root element after an optional BOM
+    if header.removeprefix(b"\xef\xbb\xbf").lstrip()[:1] == b"<":
+        return "image/svg+xml"
+    return None
+
+
+def validate_file_content(header: bytes, mime_type: str) -> str:
+    """
+    Validate that the file content matches its declared MIME type.
+
+    Args:
+        header: The first bytes of the file.
+        mime_type: The normalized declared MIME type.
+
+    Returns:
+        The sniffed MIME type.
+
+    Raises:
+        FileValidationError: If the content is not the declared image type.
+    """
+    sniffed = sniff_image_type(header)
+    if sniffed != mime_type:
+        raise FileValidationError(
+            f"File content does not match declared type '{mime_type}'",
+            "CONTENT_TYPE_MISMATCH",
+        )
+    return sniffed
+
+
 async def validate_image_file(
     file: UploadFile,
     settings: Settings | None = None,
@@ -162,7 +249,8 @@ async def validate_image_file(
     """
     Perform comprehensive validation on an image file.
 
-    Validates extension, size, and MIME type.
+    Validates extension, size, MIME type, and that the leading bytes match
+    the declared type.
 
     Args:
         file: The uploaded file.
@@ -178,7 +266,6 @@ async def validate_image_file(
     # - Validate extension
     # - Validate size
     # - Validate MIME type
-    # - Optionally verify actual file content matches claimed type
 
     settings = settings or get_settings()
 
@@ -187,8 +274,10 @@ async def validate_image_file(
         file_size = validate_file_size(file, settings=settings)
         mime_type = validate_mime_type(file.content_type, settings=settings)
 
-        # TODO: Optionally verify file magic bytes match claimed type
-        # This provides additional security against spoofed content types
+        # Check magic bytes so spoofed content types never reach the decoders
+        header = await file.read(SNIFF_SIZE)
+        await file.seek(0)
+        validate_file_content(header, mime_type)
 
         return {
             "extension": extension,
@@ -200,7 +289,11 @@ async def validate_image_file(
     except FileValidationError as e:
         logger.warning(f"File validation failed: {e.message}")
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=(
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+                if e.code == "FILE_TOO_LARGE"
+                else status.HTTP_400_BAD_REQUEST
+            ),
             detail={
                 "code": e.code,
                 "message": e.message,
@@ -208,6 +301,44 @@ async def validate_image_file(
         ) from e
 
 
+async def read_image_upload(
+    file: UploadFile,
+    settings: Settings | None = None,
+) -> ImageUpload:
+    """
+    Validate an image upload and read it in a single chunked pass.
+
+    The content digest is computed while reading, so services can key
+    caches on it without hashing the bytes a second time.
+
+    Args:
+        file: The uploaded file.
+        settings: Application settings.
+
+    Returns:
+        ImageUpload holding the file bytes and their BLAKE2b digest.
+
+    Raises:
+        HTTPException: If validation fails.
+    """
+    await validate_image_file(file, settings=settings)
+
+    # Bounded reads keep each await short; joining once copies the data a single
+    # time instead of regrowing a buffer and copying it out again
+    chunks: list[bytes] = []
+    hasher = hashlib.blake2b(digest_size=16)
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        chunks.append(chunk)
+        hasher.update(chunk)
+
+    return ImageUpload(
+        content=b"".join(chunks),
+        filename=file.filename,
+        content_type=file.content_type,
+        digest=hasher.hexdigest(),
+    )
+
+
 def get_supported_formats(settings: Settings | None = None) -> dict:
     """
     Get information about supported file formats.
@@ -226,3 +357,40 @@ def get_supported_formats(settings: Settings | None = None) -> dict:
         "max_size_mb": settings.max_file_size_mb,
         "max_size_bytes": settings.max_file_size_bytes,
     }
+
+
+def read_image_dimensions(content: bytes) -> tuple[int, int] | None:
+    """
+    Read the pixel size of a PNG or JPEG from its header, without decoding it.
+
+    Args:
+        content: The image file bytes.
+
+    Returns:
+        Tuple of (width, height), or None if the format is not recognized.
+    """
+    if content[:8] == PNG_SIGNATURE and content[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", content[16:24])
+        return width, height
+
+    if content[:2] != JPEG_SOI:
+        return None
+
+    # Walk the marker segments up to the first start-of-frame
+    pos = 2
+    while pos + 9 <= len(content):
+        if content[pos] != 0xFF:
+            return None
+        marker = content[pos + 1]
+        if marker == 0xFF:  # fill byte
+            pos += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:  # standalone markers
+            pos += 2
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">HH", content[pos + 5 : pos + 9])
+            return width, height
+        pos += 2 + int.from_bytes(content[pos + 2 : pos + 4], "big")
+
+    return None
@@ -0,0 +1,43 @@
+"""
+Identifier generation helpers.
+"""
+
+import os
+import time
+import uuid
+
+_RAND_A_MASK = (1 << 12) - 1
+_RAND_B_MASK = (1 << 62) - 1
+_TIMESTAMP_MASK = (1 << 48) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so IDs created
+    later sort after earlier ones and land on the same index pages instead
+    of being scattered like uuid4.
+
+    Returns:
+        A version 7 UUID.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+
+    value = (timestamp_ms & _TIMESTAMP_MASK) << 80
+    value |= 0x7 << 76  # version
+    value |= ((rand >> 62) & _RAND_A_MASK) << 64
+    value |= 0b10 << 62  # RFC 4122 variant
+    value |= rand & _RAND_B_MASK
+    return uuid.UUID(int=value)
+
+
+def generate_validation_id() -> str:
+    """
+    Generate a new validation ID.
+
+    Returns:
+        A time-ordered UUID string (36 characters).
+    """
+    return str(uuid7())
@@ -0,0 +1,68 @@
+"""
+Pre-serialized JSON payloads for endpoints whose responses never change.
+"""
+
+import hashlib
+from dataclasses import dataclass
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True, slots=True)
+class StaticPayload:
+    """A response body serialized once, with its strong ETag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "StaticPayload":
+        """
+        Serialize a response model once and derive its ETag.
+
+        Args:
+            model: The response model to freeze.
+
+        Returns:
+            StaticPayload holding the JSON bytes and a quoted ETag.
+        """
+        body = model.__pydantic_serializer__.to_json(model)
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return cls(body=body, etag=etag)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def static_json_response(
+    request: Request,
+    payload: StaticPayload,
+    max_age: int = 3600,
+    private: bool = False,
+) -> Response:
+    """
+    Send a pre-serialized payload, answering conditional requests with 304.
+
+    Args:
+        request: The incoming request (for If-None-Match).
+        payload: The pre-serialized body and ETag.
+        max_age: Cache-Control max-age in seconds.
+        private: Mark the response private so shared caches do not store it;
+            set this for endpoints that require authentication.
+
+    Returns:
+        A 200 JSON response, or an empty 304 if the client copy is current.
+    """
+    scope = "private" if private else "public"
+    headers = {"ETag": payload.etag, "Cache-Control": f"{scope}, max-age={max_age}"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, payload.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=payload.body, media_type="application/json", headers=headers)
@@ -0,0 +1,35 @@
+"""
+Tests for the brand color alignment script.
+"""
+
+import pytest
+
+from app.scripts.BrandColorAlignment import BrandColorAnalyzer
+
+# Red, blue and white in OpenCV 8-bit Lab
+PALETTE = [
+    {"hex": "#ff0000", "lab": [136.0, 208.0, 195.0], "coverage": 0.5},
+    {"hex": "#0000ff", "lab": [82.0, 207.0, 20.0], "coverage": 0.3},
+    {"hex": "#ffffff", "lab": [255.0, 128.0, 128.0], "coverage": 0.2},
+]
+
+
+def test_group_palette_zero_threshold_keeps_every_color() -> None:
+    """A threshold of 0 must not merge distinct colors."""
+    grouped = BrandColorAnalyzer().group_palette(PALETTE, similarity_threshold=0.0)
+
+    assert [c["coverage"] for c in grouped] == [0.5, 0.3, 0.2]
+
+
+def test_group_palette_merges_close_colors() -> None:
+    """Colors within the threshold collapse into one coverage-weighted group."""
+    palette = [
+        {"hex": "#ff0000", "lab": [136.0, 208.0, 195.0], "coverage": 0.6},
+        {"hex": "#fe0000", "lab": [135.0, 208.0, 194.0], "coverage": 0.4},
+    ]
+
+    grouped = BrandColorAnalyzer().group_palette(palette, similarity_threshold=15.0)
+
+    assert len(grouped) == 1
+    assert grouped[0]["coverage"] == pytest.approx(1.0)
+    assert grouped[0]["lab"][0] == pytest.approx(135.6, abs=1e-3)
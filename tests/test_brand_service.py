@@ -0,0 +1,48 @@
+"""
+Tests for the brand service.
+"""
+
+import hashlib
+
+import cv2
+import numpy as np
+
+from app.models.requests import BrandExtractColorsRequest
+from app.services.brand_service import BrandService
+from app.utils.file_validation import ImageUpload
+
+
+def _png_upload(width: int = 40, height: int = 30) -> ImageUpload:
+    """Build an in-memory PNG upload split into a red and a blue half."""
+    bgr = np.zeros((height, width, 3), np.uint8)
+    bgr[:, : width // 2] = (0, 0, 255)
+    bgr[:, width // 2 :] = (255, 0, 0)
+    content = cv2.imencode(".png", bgr)[1].tobytes()
+    return ImageUpload(
+        content=content,
+        filename="banner.png",
+        content_type="image/png",
+        digest=hashlib.blake2b(content, digest_size=16).hexdigest(),
+    )
+
+
+async def test_extract_colors_skips_decode_on_palette_cache_hit() -> None:
+    """A repeat upload is answered from the palette cache without decoding."""
+    service = BrandService()
+    decode_calls = []
+    decode_image = service._decode_image
+
+    def counting_decode(image: ImageUpload) -> np.ndarray | None:
+        decode_calls.append(image.digest)
+        return decode_image(image)
+
+    service._decode_image = counting_decode
+    upload = _png_upload()
+    request = BrandExtractColorsRequest(max_colors=4)
+
+    first = await service.extract_colors(upload, request, "user")
+    second = await service.extract_colors(upload, request, "user")
+
+    assert len(decode_calls) == 1
+    assert second.colors == first.colors
+    assert (second.image_metadata.width, second.image_metadata.height) == (40, 30)
@@ -0,0 +1,145 @@
+"""
+Tests that service-built responses serialize the same with and without validation.
+"""
+
+from datetime import datetime
+
+from app.models.common import BoundingBox, ImageMetadata
+from app.models.enums import BrandComplianceLevel, WCAGLevel
+from app.models.responses import (
+    BrandValidationResponse,
+    ColorRecommendation,
+    DetectedColorMatch,
+    WCAGIssue,
+    WCAGTextContrastResponse,
+    WCAGValidationResponse,
+)
+from app.services.brand_service import HEATMAP_URL_TEMPLATE
+
+TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0)
+
+IMAGE_METADATA = ImageMetadata(
+    filename="banner.png",
+    size_bytes=2048,
+    width=640,
+    height=480,
+    format="png",
+    mime_type="image/png",
+)
+
+
+def _assert_dump_parity(model: type, **fields) -> None:
+    """Compare the dump of a constructed model with the dump of a validated one."""
+    constructed = model.model_construct(**fields)
+    validated = model.model_validate(fields)
+    assert constructed.model_dump() == validated.model_dump()
+    assert constructed.model_dump(mode="json") == validated.model_dump(mode="json")
+    assert constructed.model_dump_json() == validated.model_dump_json()
+
+
+def test_brand_validation_response_construct_matches_validated_dump() -> None:
+    """Constructed brand responses with constructed color matches dump identically."""
+    matches = [
+        DetectedColorMatch.model_construct(
+            detected_color="#ff0000",
+            detected_color_name="Red",
+            nearest_brand_color="#fe0101",
+            match_percentage=98.5,
+            coverage_percentage=42.0,
+            description="This Red is close to brand Red: 98% match",
+        ),
+        DetectedColorMatch.model_construct(
+            detected_color="#00ff00",
+            detected_color_name="Lime",
+            nearest_brand_color="#0000ff",
+            match_percentage=12.0,
+            coverage_percentage=8.0,
+            description="This Lime differs from brand Blue: 12% match",
+        ),
+    ]
+
+    for heatmap_url in (HEATMAP_URL_TEMPLATE.format(validation_id="abc"), None):
+        _assert_dump_parity(
+            BrandValidationResponse,
+            success=True,
+            message="Brand validation completed",
+            timestamp=TIMESTAMP,
+            validation_id="abc",
+            brand_color_match="Brand color match: 86%",
+            compliance_score=86.2,
+            compliance_level=BrandComplianceLevel.COMPLIANT,
+            top_color_matches=matches,
+            heatmap_url=heatmap_url,
+            image_metadata=IMAGE_METADATA,
+            processed_at=TIMESTAMP,
+        )
+
+
+def test_wcag_validation_response_construct_matches_validated_dump() -> None:
+    """Constructed WCAG validation responses dump identically."""
+    issues = [
+        WCAGIssue(
+            criterion="1.4.3",
+            level=WCAGLevel.AA,
+            title="Insufficient contrast",
+            description="Text contrast is 3.1:1",
+            impact="serious",
+            location=BoundingBox(x=10, y=20, width=100, height=30),
+            suggestion="Darken the text color",
+        ),
+        WCAGIssue(
+            criterion="1.4.11",
+            level=WCAGLevel.AA,
+            title="Low non-text contrast",
+            description="Icon contrast is 2.0:1",
+            impact="moderate",
+        ),
+    ]
+
+    _assert_dump_parity(
+        WCAGValidationResponse,
+        success=True,
+        message="WCAG validation completed",
+        timestamp=TIMESTAMP,
+        validation_id="def",
+        is_compliant=False,
+        compliance_score=50.0,
+        wcag_level_achieved=WCAGLevel.A,
+        issues=issues,
+        issues_total=5,
+        issues_truncated=True,
+        passed_criteria=["1.4.1"],
+        suggestions=["Increase text contrast"],
+        image_metadata=IMAGE_METADATA,
+        processed_at=TIMESTAMP,
+    )
+
+
+def test_wcag_text_contrast_response_construct_matches_validated_dump() -> None:
+    """Constructed text contrast responses dump identically, with or without recommendations."""
+    recommendations = [
+        ColorRecommendation(
+            original_color="#777777",
+            suggested_color="#595959",
+            contrast_ratio=7.0,
+            passes_wcag=True,
+            adjustment_type="darken",
+        )
+    ]
+
+    for recs in (recommendations, None):
+        _assert_dump_parity(
+            WCAGTextContrastResponse,
+            success=True,
+            message="Text contrast validation completed",
+            timestamp=TIMESTAMP,
+            validation_id="ghi",
+            contrast_ratio=4.48,
+            is_compliant=False,
+            required_ratio=4.5,
+            wcag_level=WCAGLevel.AA,
+            text_size_category="normal",
+            passes_aa=False,
+            passes_aaa=False,
+            recommendations=recs,
+        )